@@ -6,7 +6,7 @@ movie data APIs (TMDB, OMDb) with built-in retry logic, timeout handling,
 and standardized error classification.
 
 Key Features:
-- Automatic retries with exponential backoff
+- Automatic retries with jittered exponential backoff
 - Configurable timeouts per request
 - Error taxonomy for different failure types
 - Comprehensive logging of retry attempts and failures
@@ -21,9 +21,11 @@ Error Taxonomy:
 
 import os
 import time
+import random
 import logging
+import threading
 import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 from enum import Enum
 
 # Configure logging
@@ -80,21 +82,63 @@ class NotFoundError(APIError):
         super().__init__(message, APIErrorType.NOT_FOUND, status_code)
 
 
+# Status codes with a dedicated classification; other 5xx are transient and
+# other 4xx unknown.
+_STATUS_MAP = {
+    401: APIErrorType.AUTH,
+    403: APIErrorType.AUTH,
+    404: APIErrorType.NOT_FOUND,
+    429: APIErrorType.QUOTA,
+}
+
+# Exception types checked in order; all are retryable network failures.
+_EXC_MAP = (
+    (requests.exceptions.Timeout, APIErrorType.TRANSIENT),
+    (requests.exceptions.ConnectionError, APIErrorType.TRANSIENT),
+    (requests.exceptions.RequestException, APIErrorType.TRANSIENT),
+)
+
+# Error types raised as (message, status_code) subclasses of APIError.
+_ERROR_CLASSES = {
+    APIErrorType.AUTH: AuthError,
+    APIErrorType.QUOTA: QuotaError,
+    APIErrorType.NOT_FOUND: NotFoundError,
+}
+
+
+def _read_env_defaults() -> Dict[str, float]:
+    """Parse the API_CLIENT_* environment variables into client defaults."""
+    return {
+        "timeout": float(os.getenv("API_CLIENT_TIMEOUT", "3.0")),
+        "max_retries": int(os.getenv("API_CLIENT_MAX_RETRIES", "3")),
+        "backoff_base": float(os.getenv("API_CLIENT_BACKOFF_BASE", "0.5")),
+        "backoff_cap": float(os.getenv("API_CLIENT_BACKOFF_CAP", "10.0")),
+    }
+
+
+# Parsed once at import so constructing a client does no env lookups.
+_ENV_DEFAULTS = _read_env_defaults()
+
+
 class MovieDataClient:
     """
     HTTP client for movie data APIs with retry logic and error handling.
     
-    Configuration via environment variables:
+    Configuration via environment variables (read once, when this module is imported):
     - API_CLIENT_TIMEOUT: Default timeout in seconds (default: 3.0)
     - API_CLIENT_MAX_RETRIES: Maximum retry attempts (default: 3)
     - API_CLIENT_BACKOFF_BASE: Base delay for exponential backoff in seconds (default: 0.5)
+    - API_CLIENT_BACKOFF_CAP: Upper bound on a single backoff delay in seconds (default: 10.0)
     """
     
     def __init__(
         self,
         timeout: Optional[float] = None,
         max_retries: Optional[int] = None,
-        backoff_base: Optional[float] = None
+        backoff_base: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        backoff_cap: Optional[float] = None,
+        seed: Optional[int] = None
     ):
         """
         Initialize the MovieDataClient.
@@ -103,19 +147,40 @@ class MovieDataClient:
             timeout: Request timeout in seconds (default: 3.0 or from env)
             max_retries: Maximum number of retry attempts (default: 3 or from env)
             backoff_base: Base delay for exponential backoff (default: 0.5 or from env)
+            sleep: Function used to wait between retries (default: time.sleep);
+                tests can inject a recorder to avoid real waits
+            backoff_cap: Maximum backoff delay in seconds (default: 10.0 or from env)
+            seed: Seed for the backoff jitter generator, for reproducible delays
         """
-        self.timeout = timeout or float(os.getenv("API_CLIENT_TIMEOUT", "3.0"))
-        self.max_retries = max_retries or int(os.getenv("API_CLIENT_MAX_RETRIES", "3"))
-        self.backoff_base = backoff_base or float(os.getenv("API_CLIENT_BACKOFF_BASE", "0.5"))
+        # Explicit arguments win even when falsy, so max_retries=0 disables retries
+        self.timeout = timeout if timeout is not None else _ENV_DEFAULTS["timeout"]
+        self.max_retries = max_retries if max_retries is not None else _ENV_DEFAULTS["max_retries"]
+        self.backoff_base = backoff_base if backoff_base is not None else _ENV_DEFAULTS["backoff_base"]
+        self.backoff_cap = backoff_cap if backoff_cap is not None else _ENV_DEFAULTS["backoff_cap"]
+        self._sleep = sleep
+        self._rng = random.Random(seed)
         
-        # Create session for connection pooling
-        self.session = requests.Session()
+        # Created on first use; the lock stops threads sharing a client from
+        # each creating (and leaking) their own session
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
         
         logger.info(
             f"MovieDataClient initialized: timeout={self.timeout}s, "
             f"max_retries={self.max_retries}, backoff_base={self.backoff_base}s"
         )
     
+    @property
+    def session(self) -> requests.Session:
+        """Session used for connection pooling, created on first use."""
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = requests.Session()
+                session = self._session
+        return session
+    
     def _classify_error(self, response: Optional[requests.Response], 
                        exception: Optional[Exception]) -> APIErrorType:
         """
@@ -131,27 +196,20 @@ class MovieDataClient:
         # HTTP status code based classification
         if response is not None:
             status = response.status_code
-            
-            if status == 401 or status == 403:
-                return APIErrorType.AUTH
-            elif status == 404:
-                return APIErrorType.NOT_FOUND
-            elif status == 429:
-                return APIErrorType.QUOTA
-            elif 500 <= status < 600:
+            error_type = _STATUS_MAP.get(status)
+            if error_type is not None:
+                return error_type
+            if 500 <= status < 600:
                 return APIErrorType.TRANSIENT
-            elif 400 <= status < 500:
+            if 400 <= status < 500:
                 # Other 4xx errors are generally not transient
                 return APIErrorType.UNKNOWN
         
         # Exception based classification
         if exception is not None:
-            if isinstance(exception, requests.exceptions.Timeout):
-                return APIErrorType.TRANSIENT
-            elif isinstance(exception, requests.exceptions.ConnectionError):
-                return APIErrorType.TRANSIENT
-            elif isinstance(exception, requests.exceptions.RequestException):
-                return APIErrorType.TRANSIENT
+            for exc_class, error_type in _EXC_MAP:
+                if isinstance(exception, exc_class):
+                    return error_type
         
         return APIErrorType.UNKNOWN
     
@@ -175,7 +233,10 @@ class MovieDataClient:
     
     def _calculate_backoff(self, attempt: int) -> float:
         """
-        Calculate exponential backoff delay.
+        Calculate a "full jitter" exponential backoff delay.
+        
+        The delay is drawn uniformly from [0, min(backoff_cap, backoff_base * 2**attempt)]
+        so that clients failing together do not retry in lockstep.
         
         Args:
             attempt: Current attempt number (0-indexed)
@@ -183,8 +244,8 @@ class MovieDataClient:
         Returns:
             Delay in seconds
         """
-        # Exponential backoff: 0.5s, 1s, 2s (by default)
-        return self.backoff_base * (2 ** attempt)
+        # Upper bounds: 0.5s, 1s, 2s (by default)
+        return self._rng.uniform(0, min(self.backoff_cap, self.backoff_base * (1 << attempt)))
     
     def _raise_classified_error(self, error_type: APIErrorType, message: str, 
                                status_code: Optional[int] = None,
@@ -198,16 +259,12 @@ class MovieDataClient:
             status_code: HTTP status code (if available)
             original_error: Original exception (if available)
         """
-        if error_type == APIErrorType.AUTH:
-            raise AuthError(message, status_code)
-        elif error_type == APIErrorType.QUOTA:
-            raise QuotaError(message, status_code)
-        elif error_type == APIErrorType.NOT_FOUND:
-            raise NotFoundError(message, status_code)
-        elif error_type == APIErrorType.TRANSIENT:
+        error_class = _ERROR_CLASSES.get(error_type)
+        if error_class is not None:
+            raise error_class(message, status_code)
+        if error_type == APIErrorType.TRANSIENT:
             raise TransientError(message, status_code, original_error)
-        else:
-            raise APIError(message, error_type, status_code, original_error)
+        raise APIError(message, error_type, status_code, original_error)
     
     def get(
         self,
@@ -280,10 +337,10 @@ class MovieDataClient:
                 if self._should_retry(error_type, attempt):
                     backoff_delay = self._calculate_backoff(attempt)
                     logger.info(
-                        f"{log_context} Retrying after {backoff_delay}s "
+                        f"{log_context} Retrying after {backoff_delay:.3f}s "
                         f"(attempt {attempt + 1}/{self.max_retries}, error_type={error_type.value})"
                     )
-                    time.sleep(backoff_delay)
+                    self._sleep(backoff_delay)
                     attempt += 1
                     continue
                 
@@ -306,10 +363,10 @@ class MovieDataClient:
                 if self._should_retry(error_type, attempt):
                     backoff_delay = self._calculate_backoff(attempt)
                     logger.info(
-                        f"{log_context} Retrying after {backoff_delay}s "
+                        f"{log_context} Retrying after {backoff_delay:.3f}s "
                         f"(attempt {attempt + 1}/{self.max_retries}, error_type={error_type.value})"
                     )
-                    time.sleep(backoff_delay)
+                    self._sleep(backoff_delay)
                     attempt += 1
                     continue
                 
@@ -343,8 +400,9 @@ class MovieDataClient:
         )
     
     def close(self):
-        """Close the underlying session."""
-        self.session.close()
+        """Close the underlying session, if one was ever created."""
+        if self._session is not None:
+            self._session.close()
     
     def __enter__(self):
         """Context manager entry."""
@@ -9,33 +9,116 @@ Provides health check functions for external APIs used by Cineman:
 
 import os
 import time
+import threading
 import requests
-from typing import Dict, Any
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, wait
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Mapping, Optional, Tuple
 
+# Upper bound on the whole check_all_apis() fan-out, in seconds
+STATUS_CHECK_TIMEOUT = 10
 
-def check_gemini_status() -> Dict[str, Any]:
+# (connect, read) timeout for each probe, in seconds
+PROBE_TIMEOUT = (2, 3)
+PROBE_TIMEOUT_MS = sum(PROBE_TIMEOUT) * 1000
+
+
+def _create_session() -> requests.Session:
+    """Create a pooled session shared by all status probes."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=8,
+        # No retries: a second attempt would double a probe's worst case to
+        # STATUS_CHECK_TIMEOUT, so a dead host would be reported by the
+        # aggregator's timeout instead of by its own probe
+        max_retries=0
+    )
+    for prefix in (
+        "https://generativelanguage.googleapis.com/",
+        "https://api.themoviedb.org/",
+        "https://www.omdbapi.com/",
+    ):
+        session.mount(prefix, adapter)
+    return session
+
+
+# Reused across probes so repeated checks keep their connections alive
+_SESSION = _create_session()
+
+# Probe URL templates, filled in with the API key by refresh_api_keys()
+# pageSize=1 keeps the Gemini body to a single model entry
+_GEMINI_URL = "https://generativelanguage.googleapis.com/v1beta/models?key={}&pageSize=1"
+# The authentication endpoint validates the key with a tiny body
+_TMDB_URL = "https://api.themoviedb.org/3/authentication?api_key={}"
+# Look a movie up by IMDb id, which avoids the title search
+_OMDB_URL = "https://www.omdbapi.com/?apikey={}&i=tt0111161&plot=short"
+
+# Probe URLs with the API keys filled in, or None if a key is not
+# configured; built by refresh_api_keys()
+_GEMINI_PROBE_URL: Optional[str] = None
+_TMDB_PROBE_URL: Optional[str] = None
+_OMDB_PROBE_URL: Optional[str] = None
+
+
+def _probe_url(template: str, env_var: str) -> Optional[str]:
+    """Fill a probe URL template with the key from env_var, if it is set."""
+    api_key = os.getenv(env_var)
+    return template.format(api_key) if api_key else None
+
+
+def refresh_api_keys() -> None:
+    """
+    Re-read the API keys from the environment.
+    
+    The keys are read once at import so that each check only has to make
+    its request; call this after changing them at runtime (mainly in tests).
+    """
+    global _GEMINI_PROBE_URL, _TMDB_PROBE_URL, _OMDB_PROBE_URL
+    _GEMINI_PROBE_URL = _probe_url(_GEMINI_URL, "GEMINI_API_KEY")
+    _TMDB_PROBE_URL = _probe_url(_TMDB_URL, "TMDB_API_KEY")
+    _OMDB_PROBE_URL = _probe_url(_OMDB_URL, "OMDB_API_KEY")
+
+
+refresh_api_keys()
+
+# How long a completed status check is reused, in seconds
+STATUS_CACHE_TTL = int(os.getenv("API_STATUS_CACHE_TTL", "15"))
+
+# Last completed check: (statuses, wall-clock time, monotonic time)
+_status_cache: Optional[Tuple[Dict[str, Mapping[str, Any]], float, float]] = None
+_status_cache_lock = threading.Lock()
+
+# Held while probing so concurrent requests share one in-flight check
+_refresh_lock = threading.Lock()
+
+# Returned by every check whose key is missing; read-only so that one shared
+# object can be handed out without copying
+_NO_KEY_STATUS: Mapping[str, Any] = MappingProxyType({
+    "status": "error",
+    "message": "API key not configured",
+    "response_time": 0
+})
+
+
+def check_gemini_status() -> Mapping[str, Any]:
     """
     Check if Gemini API is accessible and configured.
     
     Returns:
-        dict: Status information with keys 'status', 'message', and 'response_time'
+        dict: Status information with keys 'status', 'message', and 'response_time';
+        a shared read-only mapping if the API key is not configured
     """
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
     
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        return {
-            "status": "error",
-            "message": "API key not configured",
-            "response_time": 0
-        }
+    url = _GEMINI_PROBE_URL
+    if not url:
+        return _NO_KEY_STATUS
     
     try:
-        # Test with Gemini API - check if key is valid
-        # Using the generativelanguage API endpoint for a simple check
-        url = f"https://generativelanguage.googleapis.com/v1beta/models?key={api_key}"
-        response = requests.get(url, timeout=5)
-        response_time = int((time.time() - start_time) * 1000)  # ms
+        response = _SESSION.get(url, timeout=PROBE_TIMEOUT)
+        response_time = (time.monotonic_ns() - start_ns) // 1_000_000  # ms
         
         if response.status_code == 200:
             return {
@@ -59,10 +142,10 @@ def check_gemini_status() -> Dict[str, Any]:
         return {
             "status": "degraded",
             "message": "Request timeout",
-            "response_time": 5000
+            "response_time": PROBE_TIMEOUT_MS
         }
     except Exception as e:
-        response_time = int((time.time() - start_time) * 1000)
+        response_time = (time.monotonic_ns() - start_ns) // 1_000_000
         return {
             "status": "error",
             "message": "Connection failed",
@@ -70,28 +153,23 @@ def check_gemini_status() -> Dict[str, Any]:
         }
 
 
-def check_tmdb_status() -> Dict[str, Any]:
+def check_tmdb_status() -> Mapping[str, Any]:
     """
     Check if TMDB API is accessible and configured.
     
     Returns:
-        dict: Status information with keys 'status', 'message', and 'response_time'
+        dict: Status information with keys 'status', 'message', and 'response_time';
+        a shared read-only mapping if the API key is not configured
     """
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
     
-    api_key = os.getenv("TMDB_API_KEY")
-    if not api_key:
-        return {
-            "status": "error",
-            "message": "API key not configured",
-            "response_time": 0
-        }
+    url = _TMDB_PROBE_URL
+    if not url:
+        return _NO_KEY_STATUS
     
     try:
-        # Test with a simple configuration endpoint
-        url = f"https://api.themoviedb.org/3/configuration?api_key={api_key}"
-        response = requests.get(url, timeout=5)
-        response_time = int((time.time() - start_time) * 1000)  # ms
+        response = _SESSION.get(url, timeout=PROBE_TIMEOUT)
+        response_time = (time.monotonic_ns() - start_ns) // 1_000_000  # ms
         
         if response.status_code == 200:
             return {
@@ -115,10 +193,10 @@ def check_tmdb_status() -> Dict[str, Any]:
         return {
             "status": "degraded",
             "message": "Request timeout",
-            "response_time": 5000
+            "response_time": PROBE_TIMEOUT_MS
         }
     except Exception as e:
-        response_time = int((time.time() - start_time) * 1000)
+        response_time = (time.monotonic_ns() - start_ns) // 1_000_000
         return {
             "status": "error",
             "message": "Connection failed",
@@ -126,28 +204,23 @@ def check_tmdb_status() -> Dict[str, Any]:
         }
 
 
-def check_omdb_status() -> Dict[str, Any]:
+def check_omdb_status() -> Mapping[str, Any]:
     """
     Check if OMDB API is accessible and configured.
     
     Returns:
-        dict: Status information with keys 'status', 'message', and 'response_time'
+        dict: Status information with keys 'status', 'message', and 'response_time';
+        a shared read-only mapping if the API key is not configured
     """
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
     
-    api_key = os.getenv("OMDB_API_KEY")
-    if not api_key:
-        return {
-            "status": "error",
-            "message": "API key not configured",
-            "response_time": 0
-        }
+    url = _OMDB_PROBE_URL
+    if not url:
+        return _NO_KEY_STATUS
     
     try:
-        # Test with a simple movie query
-        url = f"https://www.omdbapi.com/?apikey={api_key}&t=Inception&plot=short"
-        response = requests.get(url, timeout=5)
-        response_time = int((time.time() - start_time) * 1000)  # ms
+        response = _SESSION.get(url, timeout=PROBE_TIMEOUT)
+        response_time = (time.monotonic_ns() - start_ns) // 1_000_000  # ms
         
         if response.status_code == 200:
             data = response.json()
@@ -179,10 +252,10 @@ def check_omdb_status() -> Dict[str, Any]:
         return {
             "status": "degraded",
             "message": "Request timeout",
-            "response_time": 5000
+            "response_time": PROBE_TIMEOUT_MS
         }
     except Exception as e:
-        response_time = int((time.time() - start_time) * 1000)
+        response_time = (time.monotonic_ns() - start_ns) // 1_000_000
         return {
             "status": "error",
             "message": "Connection failed",
@@ -190,15 +263,142 @@ def check_omdb_status() -> Dict[str, Any]:
         }
 
 
-def check_all_apis() -> Dict[str, Dict[str, Any]]:
+# Status check for each service, in the order /api/status reports them
+STATUS_CHECKS: Dict[str, Callable[[], Mapping[str, Any]]] = {
+    "gemini": check_gemini_status,
+    "tmdb": check_tmdb_status,
+    "omdb": check_omdb_status
+}
+
+
+def check_status(service: str) -> Mapping[str, Any]:
+    """
+    Check a single external API by name.
+    
+    Args:
+        service: One of the keys of STATUS_CHECKS ('gemini', 'tmdb', 'omdb')
+    
+    Returns:
+        dict: Status information with keys 'status', 'message', and 'response_time'
+    
+    Raises:
+        ValueError: If the service is unknown
+    """
+    try:
+        check = STATUS_CHECKS[service]
+    except KeyError:
+        raise ValueError(f"Unknown service: {service}") from None
+    return check()
+
+
+def _probe_all_apis() -> Dict[str, Mapping[str, Any]]:
+    """
+    Probe all external APIs without consulting the cache.
+    
+    The individual checks run concurrently, so the total latency is that of
+    the slowest service rather than the sum of all three. A check that raises
+    or does not finish within STATUS_CHECK_TIMEOUT is reported for its own
+    service without failing the others.
+    
+    Returns:
+        dict: Dictionary with status for each API service
+    """
+    # Snapshot the table so the result keys match the checks that ran
+    checks = dict(STATUS_CHECKS)
+    results: Dict[str, Mapping[str, Any]] = {}
+    
+    executor = ThreadPoolExecutor(max_workers=len(checks))
+    try:
+        future_to_name = {executor.submit(check): name for name, check in checks.items()}
+        # Returns as soon as the last check finishes, or at the timeout
+        done, not_done = wait(future_to_name, timeout=STATUS_CHECK_TIMEOUT)
+        for future in done:
+            name = future_to_name[future]
+            try:
+                results[name] = future.result()
+            except Exception:
+                results[name] = {
+                    "status": "error",
+                    "message": "Connection failed",
+                    "response_time": 0
+                }
+        for future in not_done:
+            future.cancel()
+    finally:
+        # Don't block the caller on checks that are still running
+        executor.shutdown(wait=False)
+    
+    for name in checks:
+        results.setdefault(name, {
+            "status": "degraded",
+            "message": "Request timeout",
+            "response_time": STATUS_CHECK_TIMEOUT * 1000
+        })
+    
+    # Keep the response in a stable service order
+    return {name: results[name] for name in checks}
+
+
+def _fresh_cached_status() -> Optional[Dict[str, Dict[str, Any]]]:
+    """Return a copy of the cached statuses if they are within the TTL."""
+    with _status_cache_lock:
+        cached = _status_cache
+    if cached is not None and time.monotonic() - cached[2] < STATUS_CACHE_TTL:
+        return {name: dict(status) for name, status in cached[0].items()}
+    return None
+
+
+def check_all_apis(force_refresh: bool = False) -> Dict[str, Dict[str, Any]]:
     """
     Check status of all external APIs.
     
+    Results are reused for STATUS_CACHE_TTL seconds so that polling
+    /api/status does not probe every service on each request. When the
+    cache is stale, only one caller probes; concurrent callers wait for
+    that probe and share its result instead of starting their own.
+    
+    Args:
+        force_refresh: Probe the services even if a fresh result is cached
+    
     Returns:
         dict: Dictionary with status for each API service
     """
-    return {
-        "gemini": check_gemini_status(),
-        "tmdb": check_tmdb_status(),
-        "omdb": check_omdb_status()
-    }
+    global _status_cache
+    
+    if not force_refresh:
+        cached = _fresh_cached_status()
+        if cached is not None:
+            return cached
+    
+    with _refresh_lock:
+        if not force_refresh:
+            # Another request may have refreshed the cache while we waited
+            cached = _fresh_cached_status()
+            if cached is not None:
+                return cached
+        
+        statuses = _probe_all_apis()
+        with _status_cache_lock:
+            _status_cache = (statuses, time.time(), time.monotonic())
+    return {name: dict(status) for name, status in statuses.items()}
+
+
+def get_last_known_status() -> Optional[Tuple[Dict[str, Dict[str, Any]], float]]:
+    """
+    Return the most recent status check, however old.
+    
+    Returns:
+        tuple: (statuses, unix timestamp of the check), or None if no check has completed
+    """
+    with _status_cache_lock:
+        cached = _status_cache
+    if cached is None:
+        return None
+    return {name: dict(status) for name, status in cached[0].items()}, cached[1]
+
+
+def clear_status_cache() -> None:
+    """Forget any cached status check. Used primarily for testing."""
+    global _status_cache
+    with _status_cache_lock:
+        _status_cache = None
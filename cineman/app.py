@@ -20,6 +20,7 @@ from cineman.metrics import (
 
 
 from cineman.logging_middleware import init_logging_middleware
+from cineman.json_provider import init_json_provider
 from cineman.logging_context import set_session_id
 from cineman.logging_metrics import track_phase
 import os
@@ -36,6 +37,9 @@ STATIC_DIR = os.path.join(BASE_DIR, 'static')
 
 app = Flask(__name__, template_folder=TEMPLATE_DIR, static_folder=STATIC_DIR)
 
+# Serialize JSON responses with orjson
+init_json_provider(app)
+
 # Initialize logging middleware
 init_logging_middleware(app)
 
@@ -64,8 +68,10 @@ if os.getenv('GAE_ENV', '').startswith('standard') or os.getenv('CLOUD_RUN_SERVI
             recommendation="Configure Cloud SQL and set DATABASE_URL environment variable for production"
         )
 else:
-    # Local development - use file-based SQLite
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(BASE_DIR, 'cineman.db')
+    # Local development - use file-based SQLite unless DATABASE_URL overrides it
+    app.config['SQLALCHEMY_DATABASE_URI'] = (
+        os.getenv('DATABASE_URL') or 'sqlite:///' + os.path.join(BASE_DIR, 'cineman.db')
+    )
 
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
@@ -76,9 +82,12 @@ app.register_blueprint(api_bp, url_prefix="/api")
 
 # Initialize database tables
 def init_db():
-    """Initialize database tables."""
+    """Initialize database tables (no-op once they have been created)."""
+    if getattr(app, '_db_initialized', False):
+        return
     with app.app_context():
         db.create_all()
+    app._db_initialized = True
 
 # Initialize database when module is imported (needed for Gunicorn)
 # Wrap in try-except to handle potential issues during import
@@ -103,11 +112,9 @@ logger.info("session_manager_initialized", message="Session Manager initialized
 @app.before_request
 def ensure_db_initialized():
     """Ensure database tables exist before handling requests."""
-    if not hasattr(app, '_db_initialized'):
+    if not getattr(app, '_db_initialized', False):
         try:
-            with app.app_context():
-                db.create_all()
-            app._db_initialized = True
+            init_db()
             logger.info("database_verified", message="Database tables verified/created on first request")
         except Exception as e:
             logger.error("database_verification_failed", error=str(e))
@@ -138,7 +145,10 @@ def after_request_metrics(response):
 @app.route('/health')
 def health():
     """Health check endpoint for deployment monitoring."""
-    return jsonify({"status": "healthy", "service": "cineman"}), 200
+    response = jsonify({"status": "healthy", "service": "cineman"})
+    # The body never changes, so pollers can revalidate with If-None-Match
+    response.add_etag()
+    return response.make_conditional(request)
 
 # --- Route to serve the HTML chat interface ---
 @app.route('/')
@@ -291,9 +301,16 @@ def clear_session():
         logger.error("session_clear_failed", error=str(e))
         return jsonify({"status": "error", "message": "Failed to clear session. Please try again."}), 500
 
-if __name__ == '__main__':
-    # Run the server locally
+def run_dev_server():
+    """Run the local development server (shared by run.py and `python -m cineman.app`)."""
     init_db()
     port = int(os.getenv('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=True)
+    # The reloader re-imports the whole app in a child process, so only
+    # enable it when actually developing.
+    use_reloader = os.getenv('FLASK_ENV') == 'development' or os.getenv('DEBUG') == '1'
+    app.run(host='0.0.0.0', port=port, debug=True, use_reloader=use_reloader)
+
+if __name__ == '__main__':
+    # Run the server locally
+    run_dev_server()
 
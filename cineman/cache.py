@@ -8,7 +8,7 @@ improves performance by caching frequently-accessed movie data.
 Key Features:
 - Normalized key generation (title, year, case/punctuation handling)
 - Configurable TTL (time-to-live) with default 24h, override via ENV
-- LRU eviction when cache size exceeds maximum
+- Segmented LRU eviction when cache size exceeds maximum
 - Structured logging for cache events (hits, misses, evictions)
 - Cache statistics and metrics tracking
 - Extensible design for future Redis/distributed cache support
@@ -29,65 +29,257 @@ Usage Example:
     >>> print(f"Hit ratio: {stats['hit_ratio']:.2%}")
 """
 
+import functools
+import heapq
 import os
 import re
+import sys
+import threading
 import time
 import logging
-from typing import Dict, Any, Optional, Tuple
-from collections import OrderedDict
+from typing import Callable, Dict, Any, Iterable, List, Mapping, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Key normalization patterns, compiled once rather than on every lookup
+_PUNCTUATION_RE = re.compile(r"[^\w\s'-]")
+_LEADING_ARTICLE_RE = re.compile(r'^(a|an|the)\s+')
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_LEADING_ARTICLES = frozenset(("a", "an", "the"))
 
-@dataclass
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_key_cached(title: str, year: Optional[str], source: str) -> str:
+    """
+    Build the normalized cache key for a title (see MovieCache._normalize_key).
+    
+    Memoized because the same titles are looked up over and over, and the
+    result depends only on the arguments.
+    """
+    if not title:
+        return sys.intern(f"{source}:")
+    
+    # Convert to lowercase
+    normalized = title.lower()
+    
+    if (
+        normalized.isascii()
+        and normalized.replace(' ', '').isalnum()
+        and '  ' not in normalized
+        and normalized[0] != ' '
+        and normalized[-1] != ' '
+    ):
+        # Fast path for plain titles ("Inception", "The Dark Knight"): no
+        # punctuation and already-single spacing, so only an article can change
+        first_word, _, rest = normalized.partition(' ')
+        if rest and first_word in _LEADING_ARTICLES:
+            normalized = rest
+    else:
+        # Remove common punctuation but keep hyphens and apostrophes
+        normalized = _PUNCTUATION_RE.sub('', normalized)
+        
+        # Normalize whitespace
+        normalized = ' '.join(normalized.split())
+        
+        # Remove leading articles (a, an, the)
+        normalized = _LEADING_ARTICLE_RE.sub('', normalized, count=1)
+    
+    # Build key with source prefix and optional year. The string is returned
+    # from the memo above, so its hash is computed once and dict lookups
+    # match it by identity; a tuple key would rehash its items on every lookup.
+    key = f"{source}:{normalized}"
+    if year:
+        # Extract year if in format like "2010" or "2010-2012"
+        year_match = _YEAR_RE.search(str(year))
+        if year_match:
+            key = f"{key}:{year_match.group(0)}"
+    
+    # Interned so spellings that normalize alike ("Inception", "INCEPTION")
+    # share one key object and dict probes never fall back to comparing text
+    return sys.intern(key)
+
+
+@dataclass(slots=True)
 class CacheEntry:
     """
     Represents a single cache entry with metadata.
     
+    Uses __slots__: a full cache holds max_size of these, and slots drop
+    the per-instance __dict__.
+    
     Attributes:
         value: The cached data
-        timestamp: When the entry was created (Unix timestamp)
+        timestamp: When the entry was created (time.monotonic_ns())
         ttl: Time-to-live in seconds
+        expires_at: Monotonic time (ns) after which the entry is stale
         source: Data source identifier (e.g., "tmdb", "omdb")
         hits: Number of times this entry was accessed
         normalized_key: The normalized cache key
+        protected: Whether the entry is in the protected LRU segment
+        prev: Previous (less recently used) entry in the LRU list
+        next: Next (more recently used) entry in the LRU list
     """
     value: Dict[str, Any]
-    timestamp: float
+    timestamp: int
     ttl: float
     source: str
+    expires_at: int = 0
     hits: int = 0
     normalized_key: str = ""
+    protected: bool = False
+    prev: Any = field(default=None, repr=False, compare=False)
+    next: Any = field(default=None, repr=False, compare=False)
+
+
+class _LRUList:
+    """
+    Intrusive doubly-linked list of cache entries, least recently used first.
+    
+    Entries carry their own prev/next links, so moving an entry to the most
+    recently used end is a handful of pointer assignments with no hashing.
+    A sentinel root closes the list into a ring, which removes the empty-list
+    and end-of-list special cases.
+    
+    Not thread-safe: each operation is several pointer updates, and
+    interleaved calls corrupt the ring. Callers must serialize access
+    (MovieCache holds its lock around every use).
+    """
+    
+    __slots__ = ("prev", "next")
+    
+    def __init__(self):
+        self.prev = self
+        self.next = self
+    
+    def append(self, entry: CacheEntry) -> None:
+        """Link entry in as the most recently used."""
+        last = self.prev
+        entry.prev = last
+        entry.next = self
+        last.next = entry
+        self.prev = entry
+    
+    @staticmethod
+    def unlink(entry: CacheEntry) -> None:
+        """Remove entry from the list."""
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+        entry.prev = entry.next = None
+    
+    def move_to_end(self, entry: CacheEntry) -> None:
+        """Mark entry as the most recently used."""
+        if self.prev is not entry:
+            self.unlink(entry)
+            self.append(entry)
+    
+    def oldest(self) -> Optional[CacheEntry]:
+        """Return the least recently used entry, or None if the list is empty."""
+        return None if self.next is self else self.next
+    
+    def clear(self) -> None:
+        """Drop every entry from the list."""
+        self.prev = self
+        self.next = self
 
 
-@dataclass
+class _FrequencySketch:
+    """
+    Count-min sketch of recent key frequencies, used for TinyLFU admission.
+    
+    Each key bumps one counter in each of four rows; its estimate is the
+    smallest of those counters. Counters saturate at 15 and are all halved
+    once every sample_size increments, so old popularity fades.
+    """
+    
+    MAX_COUNT = 15
+    _SEEDS = (0x97CB3127, 0xB492B66F, 0x9AE16A3B, 0xCBF29CE5)
+    
+    __slots__ = ("_rows", "_mask", "_additions", "_sample_size")
+    
+    def __init__(self, capacity: int):
+        width = 1
+        while width < max(16, capacity * 4):
+            width <<= 1
+        self._rows = [[0] * width for _ in self._SEEDS]
+        self._mask = width - 1
+        self._additions = 0
+        self._sample_size = 10 * max(1, capacity)
+    
+    def _indexes(self, key: str) -> List[int]:
+        # One hash per key, spread into a different column per row
+        h = hash(key)
+        mask = self._mask
+        return [((h * seed) >> 24) & mask for seed in self._SEEDS]
+    
+    def increment(self, key: str) -> None:
+        """Count one occurrence of key."""
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < self.MAX_COUNT:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._age()
+    
+    def estimate(self, key: str) -> int:
+        """Return the (over-)estimated recent frequency of key."""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+    
+    def _age(self) -> None:
+        for row in self._rows:
+            row[:] = [count >> 1 for count in row]
+        self._additions //= 2
+
+
+@dataclass(slots=True)
 class CacheStats:
     """
     Cache statistics and metrics.
     
     Attributes:
-        total_requests: Total number of cache lookups
         hits: Number of cache hits
         misses: Number of cache misses
         evictions: Number of entries evicted (TTL or LRU)
         current_size: Current number of entries in cache
         max_size: Maximum allowed cache size
+        total_requests: Total number of cache lookups (hits + misses)
         hit_ratio: Cache hit ratio (0.0 to 1.0)
+    
+    Derived values are computed when read, so lookups only bump one counter.
     """
-    total_requests: int = 0
     hits: int = 0
     misses: int = 0
     evictions: int = 0
     current_size: int = 0
     max_size: int = 0
     
+    @property
+    def total_requests(self) -> int:
+        """Total number of cache lookups."""
+        return self.hits + self.misses
+    
     @property
     def hit_ratio(self) -> float:
         """Calculate cache hit ratio."""
-        if self.total_requests == 0:
+        total = self.hits + self.misses
+        if total == 0:
             return 0.0
-        return self.hits / self.total_requests
+        return self.hits / total
+
+
+# Share of max_size reserved for entries that were hit at least once
+PROTECTED_RATIO = 0.8
+
+# Eviction policies: plain segmented LRU, or LRU with TinyLFU admission
+CACHE_POLICIES = ("lru", "tinylfu")
+
+# Most expired entries dropped by a single get/set, so no call pays for a backlog
+EXPIRY_PURGE_BATCH = 8
+
+# Stale expiry-heap items tolerated beyond 2x the live entries before a rebuild
+EXPIRY_HEAP_SLACK = 64
+
+_NS_PER_SECOND = 1_000_000_000
 
 
 class MovieCache:
@@ -98,12 +290,28 @@ class MovieCache:
     for movie metadata from TMDB and OMDb APIs. It uses normalized keys for better
     hit rates and automatically evicts stale entries.
     
+    Expiry times are also kept in a min-heap, and each get/set drops a bounded
+    batch of expired entries from its head. Entries that are never looked up
+    again are reclaimed instead of sitting in memory until LRU pushes them out.
+    
+    Eviction uses a segmented LRU: new entries start on probation and move to
+    a protected segment on their first hit. Evictions take the least recently
+    used probationary entry first, so a sweep of one-off lookups cannot flush
+    titles that are actually being re-requested.
+    
     Configuration (via environment variables):
         MOVIE_CACHE_TTL: Default TTL in seconds (default: 86400 = 24 hours)
         MOVIE_CACHE_MAX_SIZE: Maximum number of entries (default: 1000)
         MOVIE_CACHE_ENABLED: Enable/disable caching (default: 1)
+        MOVIE_CACHE_POLICY: "lru" (default) or "tinylfu"
+    
+    With the "tinylfu" policy, a new title only displaces the LRU victim when
+    a frequency sketch says it has been requested at least as often recently.
+    Under many cold one-off lookups this keeps popular titles resident.
     
     Thread Safety Note:
+        Every operation that touches the entries, LRU segments or expiry heap
+        holds an internal lock, so one instance can be shared by threads.
         This implementation is designed for single-process use. For multi-process
         or distributed deployments, consider using Redis or similar distributed cache.
     """
@@ -112,7 +320,9 @@ class MovieCache:
         self,
         ttl: Optional[int] = None,
         max_size: Optional[int] = None,
-        enabled: Optional[bool] = None
+        enabled: Optional[bool] = None,
+        policy: Optional[str] = None,
+        clock: Optional[Callable[[], int]] = None
     ):
         """
         Initialize the movie cache.
@@ -121,21 +331,56 @@ class MovieCache:
             ttl: Time-to-live in seconds (default: from env or 86400)
             max_size: Maximum cache entries (default: from env or 1000)
             enabled: Enable/disable cache (default: from env or True)
+            policy: Eviction policy, "lru" or "tinylfu" (default: from env or "lru")
+            clock: Monotonic time source in nanoseconds (default: time.monotonic_ns);
+                tests pass a fake clock to expire entries without sleeping
+        
+        Raises:
+            ValueError: If policy is not one of CACHE_POLICIES
         """
         # Configuration with environment variable fallbacks
         self.ttl = ttl if ttl is not None else int(os.getenv("MOVIE_CACHE_TTL", "86400"))
         self.max_size = max_size if max_size is not None else int(os.getenv("MOVIE_CACHE_MAX_SIZE", "1000"))
         self.enabled = enabled if enabled is not None else (os.getenv("MOVIE_CACHE_ENABLED", "1") != "0")
-        
-        # Cache storage using OrderedDict for LRU behavior
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.policy = policy if policy is not None else os.getenv("MOVIE_CACHE_POLICY", "lru")
+        if self.policy not in CACHE_POLICIES:
+            raise ValueError(f"Unknown cache policy {self.policy!r}; expected one of {CACHE_POLICIES}")
+        
+        self._clock = clock if clock is not None else time.monotonic_ns
+        
+        # Recent key frequencies, only kept for TinyLFU admission
+        self._sketch = _FrequencySketch(self.max_size) if self.policy == "tinylfu" else None
+        
+        # Cache storage: key -> entry, with recency kept in intrusive lists for
+        # the probationary and protected segments
+        self._cache: Dict[str, CacheEntry] = {}
+        self._probation = _LRUList()
+        self._protected = _LRUList()
+        self._protected_size = 0
+        self._protected_max = max(1, int(self.max_size * PROTECTED_RATIO))
+        
+        # source -> keys of its entries, so clear(source) skips other sources
+        self._by_source: Dict[str, Set[str]] = {}
+        
+        # (expires_at, key) min-heap; items left behind by updates or manual
+        # evictions are skipped when they reach the head, and the heap is
+        # rebuilt once they outnumber the live entries
+        self._expiry_heap: List[Tuple[int, str]] = []
+        # Earliest expiry in the heap, so calls with nothing to purge only
+        # compare two floats
+        self._next_expiry_at = float("inf")
         
         # Statistics tracking
         self._stats = CacheStats(max_size=self.max_size)
         
+        # Guards all of the state above: an LRU move or eviction is several
+        # pointer updates that must not interleave with another thread's.
+        # Key normalization runs before the lock is taken.
+        self._lock = threading.Lock()
+        
         logger.info(
             f"MovieCache initialized: enabled={self.enabled}, ttl={self.ttl}s, "
-            f"max_size={self.max_size}"
+            f"max_size={self.max_size}, policy={self.policy}"
         )
     
     def _normalize_key(self, title: str, year: Optional[str] = None, source: str = "") -> str:
@@ -164,30 +409,75 @@ class MovieCache:
             >>> cache._normalize_key("Spider-Man", source="omdb")
             'omdb:spider-man'
         """
-        if not title:
-            return f"{source}:"
-        
-        # Convert to lowercase
-        normalized = title.lower()
-        
-        # Remove common punctuation but keep hyphens and apostrophes
-        normalized = re.sub(r"[^\w\s'-]", '', normalized)
-        
-        # Normalize whitespace
-        normalized = ' '.join(normalized.split())
+        return _normalize_key_cached(title, year, source)
+    
+    def _unlink(self, entry: CacheEntry) -> None:
+        """Remove entry from whichever LRU segment holds it."""
+        _LRUList.unlink(entry)
+        if entry.protected:
+            self._protected_size -= 1
+    
+    def _remove(self, entry: CacheEntry) -> None:
+        """Drop entry from the cache, its LRU segment and the source index."""
+        key = entry.normalized_key
+        del self._cache[key]
+        self._unlink(entry)
+        source_keys = self._by_source[entry.source]
+        source_keys.discard(key)
+        if not source_keys:
+            del self._by_source[entry.source]
+    
+    def _link(self, entry: CacheEntry) -> None:
+        """Add entry as the most recent in the segment its flag names."""
+        if entry.protected:
+            self._protected.append(entry)
+            self._protected_size += 1
+        else:
+            self._probation.append(entry)
+    
+    def _promote(self, entry: CacheEntry) -> None:
+        """
+        Record a hit: move entry to the most recent end of the protected segment.
         
-        # Remove leading articles (a, an, the)
-        normalized = re.sub(r'^(a|an|the)\s+', '', normalized)
+        If that overfills the protected segment, its least recently used entry
+        is demoted back to probation rather than evicted.
+        """
+        if entry.protected:
+            self._protected.move_to_end(entry)
+            return
         
-        # Build key with source prefix and optional year
-        key_parts = [source, normalized]
-        if year:
-            # Extract year if in format like "2010" or "2010-2012"
-            year_match = re.search(r'\b(19|20)\d{2}\b', str(year))
-            if year_match:
-                key_parts.append(year_match.group(0))
+        _LRUList.unlink(entry)
+        entry.protected = True
+        self._link(entry)
+        if self._protected_size > self._protected_max:
+            demoted = self._protected.oldest()
+            self._unlink(demoted)
+            demoted.protected = False
+            self._link(demoted)
+    
+    def _purge_expired(self, now: int) -> None:
+        """Drop up to EXPIRY_PURGE_BATCH entries whose TTL ran out before now (caller holds the lock)."""
+        heap = self._expiry_heap
+        purged = 0
+        while heap and heap[0][0] < now and purged < EXPIRY_PURGE_BATCH:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is None or entry.expires_at != expires_at:
+                continue
+            self._remove(entry)
+            self._stats.evictions += 1
+            purged += 1
+            logger.debug("Cache expired: %s (purged)", key)
         
-        return ':'.join(key_parts)
+        self._next_expiry_at = heap[0][0] if heap else float("inf")
+        if purged:
+            self._stats.current_size = len(self._cache)
+    
+    def _compact_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from live entries, dropping stale items."""
+        self._expiry_heap = [(entry.expires_at, key) for key, entry in self._cache.items()]
+        heapq.heapify(self._expiry_heap)
+        self._next_expiry_at = self._expiry_heap[0][0] if self._expiry_heap else float("inf")
     
     def get(
         self,
@@ -198,6 +488,10 @@ class MovieCache:
         """
         Retrieve value from cache if present and not expired.
         
+        The stored dict is returned as-is, without a copy, so every caller
+        shares it. Callers must not mutate it; copy first (as fetch_omdb_data_core
+        does before tagging "_cached").
+        
         Args:
             title: Movie title
             year: Optional year for better key specificity
@@ -210,36 +504,80 @@ class MovieCache:
             return None
         
         key = self._normalize_key(title, year, source)
-        self._stats.total_requests += 1
+        with self._lock:
+            now = self._clock()
+            if now > self._next_expiry_at:
+                self._purge_expired(now)
+            return self._lookup(key, now)
+    
+    def get_many(
+        self,
+        titles: Iterable[str],
+        source: str = "default"
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve several titles from one source in a single call.
+        
+        Equivalent to calling get() for each title, but reads the clock and
+        checks for expired entries once for the whole batch.
+        
+        Args:
+            titles: Movie titles to look up
+            source: Data source identifier (e.g., "tmdb", "omdb")
+            
+        Returns:
+            Dict mapping each title that was found (as passed in) to its cached value
+        """
+        if not self.enabled:
+            return {}
+        
+        keys = [(title, self._normalize_key(title, None, source)) for title in titles]
         
-        # Check if key exists
-        if key not in self._cache:
+        found = {}
+        with self._lock:
+            now = self._clock()
+            if now > self._next_expiry_at:
+                self._purge_expired(now)
+            
+            for title, key in keys:
+                value = self._lookup(key, now)
+                if value is not None:
+                    found[title] = value
+        return found
+    
+    def _lookup(self, key: str, now: int) -> Optional[Dict[str, Any]]:
+        """Look up a normalized key, recording the hit or miss (caller holds the lock)."""
+        if self._sketch is not None:
+            self._sketch.increment(key)
+        
+        # Single hash lookup for both the miss and hit paths
+        entry = self._cache.get(key)
+        if entry is None:
             self._stats.misses += 1
-            logger.debug(f"Cache miss: {key}")
+            logger.debug("Cache miss: %s", key)
             return None
         
-        entry = self._cache[key]
-        
-        # Check if entry has expired
-        age = time.time() - entry.timestamp
-        if age > entry.ttl:
+        # Check if entry has expired (monotonic, so wall-clock jumps don't matter)
+        if now > entry.expires_at:
             # Entry expired - remove it
-            del self._cache[key]
+            self._remove(entry)
             self._stats.misses += 1
             self._stats.evictions += 1
             self._stats.current_size = len(self._cache)
-            logger.debug(f"Cache expired: {key} (age: {age:.1f}s)")
+            logger.debug("Cache expired: %s (age: %.1fs)", key, (now - entry.timestamp) / _NS_PER_SECOND)
             return None
         
-        # Cache hit - move to end for LRU and increment hit counter
-        self._cache.move_to_end(key)
+        # Cache hit - promote for LRU and increment hit counter
+        self._promote(entry)
         entry.hits += 1
         self._stats.hits += 1
         
-        logger.debug(
-            f"Cache hit: {key} (age: {age:.1f}s, hits: {entry.hits}, "
-            f"hit_ratio: {self._stats.hit_ratio:.2%})"
-        )
+        # Hits are the hot path; only build the message when it will be emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Cache hit: {key} (age: {(now - entry.timestamp) / _NS_PER_SECOND:.1f}s, "
+                f"hits: {entry.hits}, hit_ratio: {self._stats.hit_ratio:.2%})"
+            )
         
         return entry.value
     
@@ -254,7 +592,11 @@ class MovieCache:
         """
         Store value in cache with optional custom TTL.
         
-        If cache is at max size, least recently used entry will be evicted.
+        If cache is at max size, the least recently used entry will be evicted,
+        taking probationary entries before protected ones.
+        
+        The cache keeps a reference to value rather than a copy, so it must
+        not be mutated after it is stored.
         
         Args:
             title: Movie title
@@ -268,29 +610,92 @@ class MovieCache:
         
         key = self._normalize_key(title, year, source)
         effective_ttl = ttl if ttl is not None else self.ttl
+        with self._lock:
+            now = self._clock()
+            if now > self._next_expiry_at:
+                self._purge_expired(now)
+            self._store(key, value, source, effective_ttl, now)
+    
+    def set_many(
+        self,
+        items: Mapping[str, Dict[str, Any]],
+        source: str = "default",
+        ttl: Optional[int] = None
+    ) -> None:
+        """
+        Store several title -> value pairs for one source in a single call.
         
-        # Check if we need to evict oldest entry (LRU)
-        if key not in self._cache and len(self._cache) >= self.max_size:
-            # Evict oldest (first) entry
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
-            self._stats.evictions += 1
-            logger.debug(f"Cache LRU eviction: {oldest_key} (max_size reached)")
+        Equivalent to calling set() for each pair, but reads the clock and
+        checks for expired entries once for the whole batch.
+        
+        Args:
+            items: Mapping of movie title to data to cache
+            source: Data source identifier (e.g., "tmdb", "omdb")
+            ttl: Optional custom TTL in seconds for every entry
+        """
+        if not self.enabled:
+            return
+        
+        effective_ttl = ttl if ttl is not None else self.ttl
+        keyed = [(self._normalize_key(title, None, source), value) for title, value in items.items()]
+        
+        with self._lock:
+            now = self._clock()
+            if now > self._next_expiry_at:
+                self._purge_expired(now)
+            
+            for key, value in keyed:
+                self._store(key, value, source, effective_ttl, now)
+    
+    def _store(self, key: str, value: Dict[str, Any], source: str, effective_ttl: float, now: int) -> None:
+        """Insert or replace the entry for a normalized key, evicting if full (caller holds the lock)."""
+        if self._sketch is not None:
+            self._sketch.increment(key)
+        
+        existing = self._cache.get(key)
+        if existing is not None:
+            self._unlink(existing)
+        elif len(self._cache) >= self.max_size:
+            # Evict least recently used entry, probationary ones first
+            oldest = self._probation.oldest() or self._protected.oldest()
+            if (
+                oldest is not None
+                and self._sketch is not None
+                and self._sketch.estimate(key) < self._sketch.estimate(oldest.normalized_key)
+            ):
+                # TinyLFU: the victim is more popular than the newcomer, keep it
+                logger.debug("Cache admission rejected: %s", key)
+                return
+            if oldest is not None:
+                self._remove(oldest)
+                self._stats.evictions += 1
+                logger.debug("Cache LRU eviction: %s (max_size reached)", oldest.normalized_key)
         
         # Store or update entry
         entry = CacheEntry(
             value=value,
-            timestamp=time.time(),
+            timestamp=now,
             ttl=effective_ttl,
             source=source,
-            normalized_key=key
+            expires_at=now + int(effective_ttl * _NS_PER_SECOND),
+            normalized_key=key,
+            # An update keeps the entry's segment
+            protected=existing is not None and existing.protected
         )
         
         self._cache[key] = entry
-        self._cache.move_to_end(key)  # Ensure it's marked as most recent
+        self._link(entry)  # Mark it as most recent
+        if existing is None:
+            self._by_source.setdefault(source, set()).add(key)
+        heapq.heappush(self._expiry_heap, (entry.expires_at, key))
+        if entry.expires_at < self._next_expiry_at:
+            self._next_expiry_at = entry.expires_at
+        if len(self._expiry_heap) > 2 * len(self._cache) + EXPIRY_HEAP_SLACK:
+            # Mostly stale items from updates/evictions; O(n) rebuild, amortized
+            self._compact_expiry_heap()
         self._stats.current_size = len(self._cache)
         
-        logger.debug(f"Cache set: {key} (ttl: {effective_ttl}s, size: {self._stats.current_size})")
+        logger.debug("Cache set: %s (ttl: %ss, size: %d)", key, effective_ttl, self._stats.current_size)
     
     def evict(self, title: str, year: Optional[str] = None, source: str = "default") -> bool:
         """
@@ -309,14 +714,16 @@ class MovieCache:
         
         key = self._normalize_key(title, year, source)
         
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return False
+            self._remove(entry)
             self._stats.evictions += 1
             self._stats.current_size = len(self._cache)
-            logger.info(f"Cache evict: {key}")
-            return True
         
-        return False
+        logger.info(f"Cache evict: {key}")
+        return True
     
     def clear(self, source: Optional[str] = None) -> int:
         """
@@ -334,23 +741,28 @@ class MovieCache:
         
         if source is None:
             # Clear all entries
-            count = len(self._cache)
-            self._cache.clear()
-            self._stats.current_size = 0
+            with self._lock:
+                count = len(self._cache)
+                self._cache.clear()
+                self._probation.clear()
+                self._protected.clear()
+                self._protected_size = 0
+                self._by_source.clear()
+                self._expiry_heap.clear()
+                self._next_expiry_at = float("inf")
+                self._stats.current_size = 0
             logger.info(f"Cache cleared: {count} entries")
             return count
         
-        # Clear entries for specific source
-        keys_to_delete = [
-            key for key, entry in self._cache.items()
-            if entry.source == source
-        ]
-        
-        for key in keys_to_delete:
-            del self._cache[key]
-        
-        count = len(keys_to_delete)
-        self._stats.current_size = len(self._cache)
+        with self._lock:
+            # Clear entries for specific source via the index, not a full scan
+            keys_to_delete = self._by_source.pop(source, ())
+            
+            for key in keys_to_delete:
+                self._unlink(self._cache.pop(key))
+            
+            count = len(keys_to_delete)
+            self._stats.current_size = len(self._cache)
         logger.info(f"Cache cleared for source '{source}': {count} entries")
         return count
     
@@ -382,15 +794,17 @@ class MovieCache:
     
     def reset_stats(self) -> None:
         """Reset cache statistics without clearing cached data."""
-        self._stats = CacheStats(
-            max_size=self.max_size,
-            current_size=len(self._cache)
-        )
+        with self._lock:
+            self._stats = CacheStats(
+                max_size=self.max_size,
+                current_size=len(self._cache)
+            )
         logger.info("Cache statistics reset")
 
 
 # Global cache instance for shared use across the application
 _global_cache: Optional[MovieCache] = None
+_global_cache_lock = threading.Lock()
 
 
 def get_cache() -> MovieCache:
@@ -398,15 +812,21 @@ def get_cache() -> MovieCache:
     Get or create the global cache instance.
     
     This ensures a single cache instance is shared across the application
-    for consistent caching behavior and statistics.
+    for consistent caching behavior and statistics. Creation is guarded by a
+    lock so concurrent first calls (e.g. parallel enrichment threads) cannot
+    build two caches; once it exists no lock is taken.
     
     Returns:
         Global MovieCache instance
     """
     global _global_cache
-    if _global_cache is None:
-        _global_cache = MovieCache()
-    return _global_cache
+    cache = _global_cache
+    if cache is None:
+        with _global_cache_lock:
+            if _global_cache is None:
+                _global_cache = MovieCache()
+            cache = _global_cache
+    return cache
 
 
 def reset_global_cache():
@@ -2,6 +2,7 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.messages import HumanMessage, AIMessage
+import functools
 import os
 import sys
 from typing import List, Dict
@@ -17,6 +18,8 @@ def load_prompt_from_file(filepath):
         raise FileNotFoundError(f"Prompt file not found at: {filepath}")
 
 # Escape braces in system prompt so ChatPromptTemplate doesn't treat JSON braces as template variables.
+_BRACE_ESCAPES = str.maketrans({"{": "{{", "}": "}}"})
+
 def escape_braces_for_prompt(text: str) -> str:
     """
     Replace single braces with doubled braces so LangChain's f-string style
@@ -27,11 +30,16 @@ def escape_braces_for_prompt(text: str) -> str:
     """
     if not text:
         return text
-    return text.replace("{", "{{").replace("}", "}}")
+    # One pass over the text instead of two chained replace() calls
+    return text.translate(_BRACE_ESCAPES)
 
 # --- CORE CHAIN LOGIC ---
 def get_recommendation_chain():
-    """Builds and returns the stable LangChain Chain for recommendations."""
+    """
+    Return the stable LangChain Chain for recommendations.
+
+    The chain is built once per API key and reused on later calls.
+    """
     
     # CRITICAL FIX: Explicitly retrieve and pass the API key 
     gemini_api_key = os.getenv("GEMINI_API_KEY")
@@ -41,6 +49,13 @@ def get_recommendation_chain():
         # The app.py will handle None and disable AI features
         return None
 
+    return _build_chain(gemini_api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_chain(gemini_api_key: str):
+    """Build the recommendation chain (cached; see get_recommendation_chain)."""
+
     # 1. Define the LLM (Gemini as the Brain)
     # **FIX:** Pass google_api_key explicitly to bypass Default Credentials Error.
     # Increase temperature to 1.2 for more creativity and variety
@@ -78,29 +93,28 @@ def get_recommendation_chain():
 
 def build_session_context(chat_history: List[Dict[str, str]], recommended_movies: List[str]) -> str:
     """Build a context string from session history for the AI."""
-    context_parts = []
-    
-    if recommended_movies:
-        context_parts.append(
-            f"\n\nIMPORTANT SESSION CONTEXT:\n"
-            f"Previously recommended movies in this session (DO NOT recommend these again):\n"
-            f"{', '.join(recommended_movies)}\n"
-            f"Please provide DIFFERENT and DIVERSE recommendations that are not in this list."
-        )
+    if not recommended_movies:
+        return ""
     
-    return "".join(context_parts)
+    return (
+        f"\n\nIMPORTANT SESSION CONTEXT:\n"
+        f"Previously recommended movies in this session (DO NOT recommend these again):\n"
+        f"{', '.join(recommended_movies)}\n"
+        f"Please provide DIFFERENT and DIVERSE recommendations that are not in this list."
+    )
+
+
+# Chat roles the prompt understands; messages with any other role are skipped
+_MESSAGE_TYPES = {"user": HumanMessage, "assistant": AIMessage}
 
 
 def format_chat_history(chat_history: List[Dict[str, str]]) -> List:
     """Convert chat history dicts to LangChain message objects."""
     messages = []
     for msg in chat_history:
-        role = msg.get("role", "")
-        content = msg.get("content", "")
-        if role == "user":
-            messages.append(HumanMessage(content=content))
-        elif role == "assistant":
-            messages.append(AIMessage(content=content))
+        message_type = _MESSAGE_TYPES.get(msg.get("role", ""))
+        if message_type is not None:
+            messages.append(message_type(content=msg.get("content", "")))
     return messages
 
 # --- SAMPLE TEST EXECUTION ---
@@ -0,0 +1,40 @@
+"""
+orjson-backed JSON provider for Flask.
+
+Every jsonify() call (and request.get_json()) goes through the app's JSON
+provider. OrjsonProvider serializes with orjson instead of the standard
+library json module.
+
+Dates and dataclasses are passed back to Flask's default handling, so they
+serialize the same way as with the default provider.
+"""
+
+from typing import Any, Union
+
+import orjson
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson."""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option).decode()
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+def init_json_provider(app: Flask) -> None:
+    """Use the orjson provider for the app."""
+    app.json = OrjsonProvider(app)
@@ -4,10 +4,12 @@ from cineman.tools.omdb import fetch_omdb_data_core
 from cineman.tools.watchmode import fetch_watchmode_data_core
 from cineman.models import db, MovieInteraction
 from cineman.schemas import parse_movie_from_api, MovieRecommendation
-from cineman.api_status import check_all_apis
+from cineman.api_status import check_all_apis, get_last_known_status, STATUS_CACHE_TTL
 from cineman.rate_limiter import get_gemini_rate_limiter
 from cineman.metrics import get_metrics, update_rate_limit_metrics
 from pydantic import ValidationError
+import hashlib
+import json
 import uuid
 import time
 
@@ -285,6 +287,18 @@ def get_all_interactions():
     })
 
 
+def _status_etag(statuses):
+    """
+    ETag for a set of service statuses; it changes only when a status does.
+    
+    response_time is left out because it differs on every probe, so a
+    client revalidating with this tag keeps its previously reported times.
+    """
+    state = {name: (s["status"], s["message"]) for name, s in statuses.items()}
+    payload = json.dumps(state, sort_keys=True).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
 @bp.route("/status", methods=["GET"])
 def api_status():
     """
@@ -295,16 +309,38 @@ def api_status():
     - status: "operational" | "degraded" | "error"
     - message: Human-readable status message
     - response_time: API response time in milliseconds
+    
+    Results are cached briefly. Responses carry an ETag derived from the
+    service statuses, and a matching If-None-Match gets an empty 304. If a
+    check fails, the last known result is returned with "stale": true unless
+    the no_fallback query parameter is set.
     """
     try:
         statuses = check_all_apis()
-        return jsonify({
-            "status": "success",
-            "timestamp": int(time.time()),
-            "services": statuses
-        })
+        etag = _status_etag(statuses)
+        if etag in request.if_none_match:
+            # The client already has these statuses; skip the body
+            response = Response(status=304)
+        else:
+            response = jsonify({
+                "status": "success",
+                "timestamp": int(time.time()),
+                "services": statuses
+            })
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = f"max-age={STATUS_CACHE_TTL}, must-revalidate"
+        return response
     except Exception as e:
         print(f"Error checking API status: {e}")
+        last_known = None if request.args.get("no_fallback") else get_last_known_status()
+        if last_known is not None:
+            statuses, checked_at = last_known
+            return jsonify({
+                "status": "success",
+                "timestamp": int(checked_at),
+                "services": statuses,
+                "stale": True
+            })
         return jsonify({
             "status": "error",
             "message": "Failed to check API status"
@@ -3,12 +3,21 @@ Data schemas for CineMan movie data.
 
 This module defines Pydantic models for movie data validation and serialization.
 These schemas ensure data consistency across API responses, LLM outputs, and frontend display.
+
+The nested sub-models use ``defer_build=True`` so their standalone validators
+are only compiled the first time they are used directly; they are still
+embedded in ``MovieRecommendation``'s schema as usual.
 """
 
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Optional, List, Dict, Any, TypedDict, Annotated
+from pydantic import BaseModel, Field, field_validator, ConfigDict, TypeAdapter, StringConstraints
 from datetime import datetime, timezone
 
+# Release year: flexible formats ("2010", "2010-2012", "2010-"), "N/A" or empty,
+# but anything else must contain at least one digit. Checked in pydantic-core.
+_YEAR_PATTERN = r'^(?:N/A|[\s\S]*\d[\s\S]*)?$'
+_YearStr = Annotated[str, StringConstraints(pattern=_YEAR_PATTERN)]
+
 
 class MovieRatings(BaseModel):
     """
@@ -23,6 +32,7 @@ class MovieRatings(BaseModel):
     metacritic: Optional[str] = Field(None, description="Metacritic score (e.g., '74/100', 'N/A')")
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "imdb_rating": "8.8",
@@ -46,6 +56,7 @@ class MovieIdentifiers(BaseModel):
     omdb_id: Optional[str] = Field(None, description="OMDB ID")
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "imdb_id": "tt1375666",
@@ -72,6 +83,7 @@ class MovieDetails(BaseModel):
     website: Optional[str] = Field(None, description="Official website URL")
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "plot": "A thief who steals corporate secrets through dream-sharing technology...",
@@ -99,6 +111,7 @@ class MovieCredits(BaseModel):
     producers: Optional[List[str]] = Field(default_factory=list, description="List of producers")
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "director": "Christopher Nolan",
@@ -120,6 +133,7 @@ class StreamingProvider(BaseModel):
     logo_url: Optional[str] = Field(None, description="URL to the service logo")
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "name": "Netflix",
@@ -131,6 +145,21 @@ class StreamingProvider(BaseModel):
     )
 
 
+class LegacyMovieDict(TypedDict):
+    """
+    Flat movie dict produced by ``MovieRecommendation.to_legacy_format``.
+    """
+    title: str
+    year: Optional[str]
+    imdb_rating: Optional[str]
+    rt_tomatometer: Optional[str]
+    rt_audience: Optional[str]
+    imdb_id: Optional[str]
+    streaming: List[Dict[str, Any]]
+    anchor_text: Optional[str]
+    anchor_id: Optional[str]
+
+
 class MovieRecommendation(BaseModel):
     """
     Complete movie recommendation schema with all metadata.
@@ -140,7 +169,7 @@ class MovieRecommendation(BaseModel):
     """
     # Basic information (required)
     title: str = Field(..., description="Movie title", min_length=1)
-    year: Optional[str] = Field(None, description="Release year (e.g., '2010')")
+    year: Optional[_YearStr] = Field(None, description="Release year (e.g., '2010')")
     
     # Ratings (aggregated)
     ratings: Optional[MovieRatings] = Field(default_factory=MovieRatings, description="Movie ratings")
@@ -175,24 +204,13 @@ class MovieRecommendation(BaseModel):
     # Additional data
     extra_data: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
 
-    @field_validator('year')
-    @classmethod
-    def validate_year(cls, v):
-        """Validate year format (optional, flexible)."""
-        if v and v != 'N/A':
-            # Allow various year formats: "2010", "2010-2012", "2010-"
-            if not any(c.isdigit() for c in v):
-                raise ValueError('Year must contain at least one digit')
-        return v
-
     @field_validator('ratings', mode='before')
     @classmethod
     def ensure_ratings(cls, v):
         """Ensure ratings is always a MovieRatings object."""
         if v is None:
             return MovieRatings()
-        if isinstance(v, dict):
-            return MovieRatings(**v)
+        # Dicts are left to pydantic-core, which builds the sub-model natively
         return v
 
     @field_validator('identifiers', mode='before')
@@ -201,8 +219,6 @@ class MovieRecommendation(BaseModel):
         """Ensure identifiers is always a MovieIdentifiers object."""
         if v is None:
             return MovieIdentifiers()
-        if isinstance(v, dict):
-            return MovieIdentifiers(**v)
         return v
 
     @field_validator('credits', mode='before')
@@ -211,8 +227,6 @@ class MovieRecommendation(BaseModel):
         """Ensure credits is always a MovieCredits object."""
         if v is None:
             return MovieCredits()
-        if isinstance(v, dict):
-            return MovieCredits(**v)
         return v
 
     @field_validator('details', mode='before')
@@ -221,8 +235,6 @@ class MovieRecommendation(BaseModel):
         """Ensure details is always a MovieDetails object."""
         if v is None:
             return MovieDetails()
-        if isinstance(v, dict):
-            return MovieDetails(**v)
         return v
 
     model_config = ConfigDict(
@@ -262,7 +274,14 @@ class MovieRecommendation(BaseModel):
         """
         return self.model_dump(exclude_none=True)
 
-    def to_legacy_format(self) -> Dict[str, Any]:
+    def to_json(self) -> str:
+        """
+        Serialize to a JSON string, excluding None values.
+        Uses pydantic-core's serializer directly instead of going through to_dict() + json.dumps.
+        """
+        return self.model_dump_json(exclude_none=True)
+
+    def to_legacy_format(self) -> LegacyMovieDict:
         """
         Convert to legacy format used by the current LLM manifest.
         This ensures backward compatibility with existing frontend code.
@@ -334,20 +353,28 @@ def parse_movie_from_api(api_data: Dict[str, Any], source: str = "combined") ->
     """
     Parse movie data from API responses (TMDB, OMDb, or combined endpoint).
     
+    The input here has already been normalized by our own TMDB/OMDb tool
+    wrappers, so models are built with ``model_construct`` (no field
+    validation). Untrusted LLM output goes through ``validate_llm_manifest``
+    instead, which runs full validation.
+    
     Args:
         api_data: Raw API response data
         source: Source of the data ("tmdb", "omdb", or "combined")
     
     Returns:
-        MovieRecommendation: Parsed and validated movie data
+        MovieRecommendation: Parsed movie data
+    
+    Raises:
+        ValueError: If no title could be extracted
     """
     movie_data = {
         "title": "",
         "year": None,
-        "ratings": MovieRatings(),
-        "identifiers": MovieIdentifiers(),
-        "credits": MovieCredits(),
-        "details": MovieDetails(),
+        "ratings": MovieRatings.model_construct(),
+        "identifiers": MovieIdentifiers.model_construct(),
+        "credits": MovieCredits.model_construct(),
+        "details": MovieDetails.model_construct(),
         "poster_url": None,
         "streaming": [],
     }
@@ -365,7 +392,7 @@ def parse_movie_from_api(api_data: Dict[str, Any], source: str = "combined") ->
         if isinstance(imdb_rating_value, (int, float)):
             imdb_rating_value = str(imdb_rating_value)
         
-        movie_data["ratings"] = MovieRatings(
+        movie_data["ratings"] = MovieRatings.model_construct(
             imdb_rating=imdb_rating_value,
             rt_tomatometer=omdb.get("Rotten_Tomatoes"),
             tmdb_rating=tmdb.get("vote_average"),
@@ -373,20 +400,21 @@ def parse_movie_from_api(api_data: Dict[str, Any], source: str = "combined") ->
         )
         
         # Identifiers
-        movie_data["identifiers"] = MovieIdentifiers(
+        movie_data["identifiers"] = MovieIdentifiers.model_construct(
             tmdb_id=tmdb.get("tmdb_id"),
             imdb_id=omdb.get("imdbID")
         )
         
         # Credits
-        movie_data["credits"] = MovieCredits(
+        movie_data["credits"] = MovieCredits.model_construct(
             director=omdb.get("Director")
         )
         
         # Poster
         movie_data["poster_url"] = tmdb.get("poster_url") or omdb.get("Poster_URL")
         
-        # Streaming
+        # Streaming - provider dicts come from Watchmode (or dummy data) and
+        # may be incomplete, so these are still validated.
         streaming_data = api_data.get("streaming", [])
         if isinstance(streaming_data, list):
             movie_data["streaming"] = [
@@ -399,11 +427,11 @@ def parse_movie_from_api(api_data: Dict[str, Any], source: str = "combined") ->
         movie_data["title"] = api_data.get("title", "")
         movie_data["year"] = api_data.get("year")
         movie_data["poster_url"] = api_data.get("poster_url")
-        movie_data["ratings"] = MovieRatings(
+        movie_data["ratings"] = MovieRatings.model_construct(
             tmdb_rating=api_data.get("vote_average"),
             tmdb_vote_count=api_data.get("vote_count")
         )
-        movie_data["identifiers"] = MovieIdentifiers(
+        movie_data["identifiers"] = MovieIdentifiers.model_construct(
             tmdb_id=api_data.get("tmdb_id")
         )
         
@@ -412,18 +440,33 @@ def parse_movie_from_api(api_data: Dict[str, Any], source: str = "combined") ->
         movie_data["title"] = api_data.get("Title", "")
         movie_data["year"] = api_data.get("Year")
         movie_data["poster_url"] = api_data.get("Poster_URL") or api_data.get("Poster")
-        movie_data["ratings"] = MovieRatings(
+        movie_data["ratings"] = MovieRatings.model_construct(
             imdb_rating=api_data.get("IMDb_Rating") or api_data.get("imdbRating"),
             rt_tomatometer=api_data.get("Rotten_Tomatoes")
         )
-        movie_data["identifiers"] = MovieIdentifiers(
+        movie_data["identifiers"] = MovieIdentifiers.model_construct(
             imdb_id=api_data.get("imdbID")
         )
-        movie_data["credits"] = MovieCredits(
+        movie_data["credits"] = MovieCredits.model_construct(
             director=api_data.get("Director")
         )
 
-    return MovieRecommendation(**movie_data)
+    # model_construct skips the min_length check, and a title is the one
+    # thing every source must provide.
+    if not movie_data["title"]:
+        raise ValueError("Movie title is required")
+
+    return MovieRecommendation.model_construct(**movie_data)
+
+
+# Built once at import; constructing a TypeAdapter is far more expensive than
+# running its validator. It takes its type and constraints from
+# MovieManifest.movies, so the validated list can be wrapped without
+# re-validating the manifest.
+_MOVIES_FIELD = MovieManifest.model_fields['movies']
+_MOVIE_LIST_ADAPTER = TypeAdapter(
+    Annotated[(_MOVIES_FIELD.annotation, *_MOVIES_FIELD.metadata)]
+)
 
 
 def validate_llm_manifest(manifest_json: Dict[str, Any]) -> MovieManifest:
@@ -440,26 +483,28 @@ def validate_llm_manifest(manifest_json: Dict[str, Any]) -> MovieManifest:
         ValueError: If manifest is invalid
     """
     try:
-        # Parse movies from legacy format
-        movies = []
-        for movie_data in manifest_json.get("movies", []):
-            movie = MovieRecommendation(
-                title=movie_data.get("title", ""),
-                year=movie_data.get("year"),
-                ratings=MovieRatings(
-                    imdb_rating=movie_data.get("imdb_rating"),
-                    rt_tomatometer=movie_data.get("rt_tomatometer"),
-                    rt_audience=movie_data.get("rt_audience")
-                ),
-                identifiers=MovieIdentifiers(
-                    imdb_id=movie_data.get("imdb_id")
-                ),
-                anchor_text=movie_data.get("anchor_text"),
-                anchor_id=movie_data.get("anchor_id")
-            )
-            movies.append(movie)
+        # Map legacy flat keys onto the nested schema as plain dicts, then
+        # validate the whole list in a single pass.
+        movies = [
+            {
+                "title": movie_data.get("title", ""),
+                "year": movie_data.get("year"),
+                "ratings": {
+                    "imdb_rating": movie_data.get("imdb_rating"),
+                    "rt_tomatometer": movie_data.get("rt_tomatometer"),
+                    "rt_audience": movie_data.get("rt_audience")
+                },
+                "identifiers": {
+                    "imdb_id": movie_data.get("imdb_id")
+                },
+                "anchor_text": movie_data.get("anchor_text"),
+                "anchor_id": movie_data.get("anchor_id")
+            }
+            for movie_data in manifest_json.get("movies", [])
+        ]
         
-        return MovieManifest(movies=movies)
+        validated = _MOVIE_LIST_ADAPTER.validate_python(movies)
+        return MovieManifest.model_construct(movies=validated)
     except Exception as e:
         raise ValueError(f"Invalid LLM manifest: {str(e)}")
 
@@ -3,42 +3,75 @@ Session Manager for CineMan application.
 Handles chat history and recommended movies tracking per session.
 """
 import uuid
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Set
 import threading
+import time
+
+# Messages kept per session; older ones are dropped (the LLM only sees the last 10)
+MAX_CHAT_HISTORY = 100
 
 
 class SessionData:
     """Data structure to hold session information."""
     
+    # One of these lives per active session; slots drop the per-instance __dict__
+    __slots__ = (
+        "session_id", "chat_history", "recommended_movies", "_recommended_set",
+        "created_at", "_last_accessed",
+    )
+    
     def __init__(self, session_id: str):
         self.session_id = session_id
-        self.chat_history: List[Dict[str, str]] = []
+        self.chat_history: Deque[Dict[str, str]] = deque(maxlen=MAX_CHAT_HISTORY)
         self.recommended_movies: List[str] = []
+        # Mirrors recommended_movies for O(1) duplicate checks; the list keeps order
+        self._recommended_set: Set[str] = set()
         self.created_at = datetime.now()
-        self.last_accessed = datetime.now()
+        # time.monotonic() of the last activity; idle checks run on every
+        # request and only need elapsed seconds, not a datetime
+        self._last_accessed = time.monotonic()
+    
+    @property
+    def last_accessed(self) -> datetime:
+        """Wall-clock time of the last activity, derived from the monotonic stamp."""
+        return datetime.now() - timedelta(seconds=self.idle_seconds())
+    
+    def idle_seconds(self) -> float:
+        """Seconds since the session was last accessed."""
+        return time.monotonic() - self._last_accessed
+    
+    def touch(self):
+        """Mark the session as accessed now."""
+        self._last_accessed = time.monotonic()
     
     def add_message(self, role: str, content: str):
-        """Add a message to chat history."""
+        """Add a message to chat history, dropping the oldest once it is full."""
         self.chat_history.append({
             "role": role,
             "content": content,
             "timestamp": datetime.now().isoformat()
         })
-        self.last_accessed = datetime.now()
+        self._last_accessed = time.monotonic()
     
     def add_recommended_movies(self, movies: List[str]):
         """Add movies to the recommended list."""
         for movie in movies:
-            if movie not in self.recommended_movies:
+            if movie not in self._recommended_set:
+                self._recommended_set.add(movie)
                 self.recommended_movies.append(movie)
-        self.last_accessed = datetime.now()
+        self._last_accessed = time.monotonic()
     
     def get_chat_history(self, limit: Optional[int] = None) -> List[Dict[str, str]]:
         """Get chat history, optionally limited to last N messages."""
-        if limit:
-            return self.chat_history[-limit:]
-        return self.chat_history
+        if limit and limit < len(self.chat_history):
+            # Walk back from the newest message so only `limit` items are touched
+            recent = list(islice(reversed(self.chat_history), limit))
+            recent.reverse()
+            return recent
+        return list(self.chat_history)
     
     def get_recommended_movies(self) -> List[str]:
         """Get list of all recommended movies in this session."""
@@ -51,7 +84,16 @@ class SessionManager:
     def __init__(self, session_timeout_minutes: int = 60):
         self._sessions: Dict[str, SessionData] = {}
         self._lock = threading.Lock()
-        self.session_timeout = timedelta(minutes=session_timeout_minutes)
+        self._timeout_seconds = session_timeout_minutes * 60.0
+    
+    @property
+    def session_timeout(self) -> timedelta:
+        """Idle time after which a session expires."""
+        return timedelta(seconds=self._timeout_seconds)
+    
+    @session_timeout.setter
+    def session_timeout(self, value: timedelta):
+        self._timeout_seconds = value.total_seconds()
     
     def create_session(self) -> str:
         """Create a new session and return the session ID."""
@@ -66,10 +108,10 @@ class SessionManager:
             session = self._sessions.get(session_id)
             if session:
                 # Check if session has expired
-                if datetime.now() - session.last_accessed > self.session_timeout:
+                if session.idle_seconds() > self._timeout_seconds:
                     del self._sessions[session_id]
                     return None
-                session.last_accessed = datetime.now()
+                session.touch()
             return session
     
     def peek_session(self, session_id: str) -> Optional[SessionData]:
@@ -78,7 +120,7 @@ class SessionManager:
             session = self._sessions.get(session_id)
             if session:
                 # Check if session has expired
-                if datetime.now() - session.last_accessed > self.session_timeout:
+                if session.idle_seconds() > self._timeout_seconds:
                     del self._sessions[session_id]
                     return None
             return session
@@ -105,10 +147,11 @@ class SessionManager:
     def cleanup_expired_sessions(self):
         """Remove expired sessions."""
         with self._lock:
-            now = datetime.now()
+            # Every session is measured against one clock reading
+            cutoff = time.monotonic() - self._timeout_seconds
             expired = [
                 sid for sid, session in self._sessions.items()
-                if now - session.last_accessed > self.session_timeout
+                if session._last_accessed < cutoff
             ]
             for sid in expired:
                 del self._sessions[sid]
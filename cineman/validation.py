@@ -22,11 +22,16 @@ from cineman.tools.tmdb import get_movie_poster_core
 from cineman.tools.omdb import fetch_omdb_data_core
 from cineman.tools.watchmode import fetch_watchmode_data_core
 from cineman.metrics import track_validation, movie_validation_duration_seconds
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent movie validations. Each validation is dominated by
+# network I/O (TMDB, OMDb and Watchmode lookups), so this is sized for I/O
+# concurrency rather than CPU count.
+MAX_VALIDATION_WORKERS = 32
+
 
 @dataclass
 class ValidationResult:
@@ -44,8 +49,14 @@ class ValidationResult:
         error_message: Human-readable error if validation failed
         should_drop: Whether this recommendation should be dropped
         latency_ms: Time taken for validation in milliseconds
-        tmdb_data: Raw TMDB response (for debugging)
-        omdb_data: Raw OMDb response (for debugging)
+        poster_url: Poster URL (TMDB preferred, OMDb fallback)
+        ratings: Ratings dict in MovieRatings shape (None values excluded)
+        tmdb_id: TMDB movie ID
+        imdb_id: IMDb ID from OMDb
+        streaming_providers: Watchmode providers, or None if Watchmode returned nothing
+        tmdb_data: Raw TMDB response (only kept when DEBUG logging is enabled)
+        omdb_data: Raw OMDb response (only kept when DEBUG logging is enabled)
+        watchmode_data: Raw Watchmode response (only kept when DEBUG logging is enabled)
     """
     is_valid: bool
     confidence: float
@@ -57,6 +68,11 @@ class ValidationResult:
     error_message: Optional[str] = None
     should_drop: bool = False
     latency_ms: float = 0.0
+    poster_url: Optional[str] = None
+    ratings: Dict[str, Any] = field(default_factory=dict)
+    tmdb_id: Optional[int] = None
+    imdb_id: Optional[str] = None
+    streaming_providers: Optional[List[Dict[str, Any]]] = None
     tmdb_data: Optional[Dict[str, Any]] = None
     omdb_data: Optional[Dict[str, Any]] = None
     watchmode_data: Optional[Dict[str, Any]] = None
@@ -267,6 +283,34 @@ def validate_against_omdb(title: str, year: Optional[str] = None) -> Dict[str, A
     }
 
 
+def _extract_ratings(tmdb_raw: Dict[str, Any], omdb_raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a MovieRatings-shaped dict from raw TMDB and OMDb responses.
+    
+    Args:
+        tmdb_raw: Raw TMDB tool response
+        omdb_raw: Raw OMDb tool response
+        
+    Returns:
+        Ratings dict with None values excluded
+    """
+    from cineman.schemas import MovieRatings
+    ratings_obj = MovieRatings()
+    ratings_obj.imdb_rating = omdb_raw.get("imdbRating") or omdb_raw.get("IMDb_Rating")
+    ratings_obj.rt_tomatometer = omdb_raw.get("Rotten_Tomatoes")
+    if not ratings_obj.rt_tomatometer and isinstance(omdb_raw.get("Ratings"), list):
+        for r in omdb_raw["Ratings"]:
+            if "Rotten Tomatoes" in r.get("Source", ""):
+                 ratings_obj.rt_tomatometer = r.get("Value")
+    
+    if tmdb_raw.get("vote_average"):
+        try:
+            ratings_obj.tmdb_rating = float(tmdb_raw["vote_average"])
+        except (TypeError, ValueError) as parse_err:
+            logger.debug(f"Failed to parse TMDB vote_average '{tmdb_raw.get('vote_average')}' as float: {parse_err}")
+    return ratings_obj.model_dump(exclude_none=True)
+
+
 def validate_llm_recommendation(
     title: str,
     year: Optional[str] = None,
@@ -333,7 +377,7 @@ def validate_llm_recommendation(
         # Wait for results
         tmdb_data = tmdb_future.result()
         tmdb_latency = tmdb_data.get("latency_ms", 0)
-        tmdb_result = tmdb_data.get("raw", {})
+        tmdb_result = tmdb_data.get("raw") or {}
         
         omdb_data = omdb_future.result()
         omdb_latency = omdb_data.get("latency_ms", 0)
@@ -460,6 +504,11 @@ def validate_llm_recommendation(
     if should_drop:
         logger.warning(f"{log_prefix} Recommendation should be dropped: {error_message}")
     
+    # Pull out the handful of fields enrichment needs so the raw API payloads
+    # don't have to outlive validation. They are only retained for debugging.
+    omdb_raw = omdb_data.get("raw") or {}
+    keep_raw = logger.isEnabledFor(logging.DEBUG)
+    
     return ValidationResult(
         is_valid=is_valid,
         confidence=confidence,
@@ -471,9 +520,14 @@ def validate_llm_recommendation(
         error_message=error_message,
         should_drop=should_drop,
         latency_ms=latency_ms,
-        tmdb_data={**tmdb_data, "latency_ms": tmdb_latency} if tmdb_data else None,
-        omdb_data={**omdb_data, "latency_ms": omdb_latency} if omdb_data else None,
-        watchmode_data={**watchmode_result, "latency_ms": watchmode_latency} if watchmode_result else None
+        poster_url=tmdb_result.get("poster_url") or omdb_raw.get("Poster_URL") or omdb_raw.get("Poster"),
+        ratings=_extract_ratings(tmdb_result, omdb_raw),
+        tmdb_id=tmdb_result.get("tmdb_id") or tmdb_result.get("id"),
+        imdb_id=omdb_raw.get("imdbID") or (omdb_raw.get("raw") or {}).get("imdbID"),
+        streaming_providers=watchmode_result.get("providers", []) if watchmode_result else None,
+        tmdb_data={**tmdb_data, "latency_ms": tmdb_latency} if keep_raw and tmdb_data else None,
+        omdb_data={**omdb_data, "latency_ms": omdb_latency} if keep_raw and omdb_data else None,
+        watchmode_data={**watchmode_result, "latency_ms": watchmode_latency} if keep_raw and watchmode_result else None
     )
 
 
@@ -510,7 +564,7 @@ def validate_movie_list(
             "movies_corrected": 0
         }
 
-    with ThreadPoolExecutor(max_workers=min(num_movies, 5)) as executor:
+    with ThreadPoolExecutor(max_workers=min(num_movies, MAX_VALIDATION_WORKERS)) as executor:
         # Prepare tasks
         future_to_movie = {}
         for i, movie in enumerate(movies):
@@ -524,79 +578,66 @@ def validate_movie_list(
             )
             future_to_movie[future] = movie
 
-        # Collect results as they complete
-        for future in as_completed(future_to_movie):
-            movie = future_to_movie[future]
-            try:
-                result = future.result()
-                total_latency += result.latency_ms
+        # Collect results as they complete. wait(FIRST_COMPLETED) returns every
+        # future that finished since the last wake-up as one batch, rather than
+        # waking the collector once per completion like as_completed does.
+        pending = set(future_to_movie)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                movie = future_to_movie[future]
+                try:
+                    result = future.result()
+                    total_latency += result.latency_ms
                 
-                # --- Enrichment (Combined logic) ---
-                enriched_movie = movie.copy()
-                
-                tmdb_raw = result.tmdb_data.get("raw", {}) if result.tmdb_data and "raw" in result.tmdb_data else (result.tmdb_data or {})
-                omdb_raw = result.omdb_data.get("raw", {}) if result.omdb_data and "raw" in result.omdb_data else (result.omdb_data or {})
-
-                # 1. Poster URL
-                # Ensure we handle the nested 'raw' or flat dict correctly
-                enriched_movie["poster_url"] = tmdb_raw.get("poster_url") or omdb_raw.get("Poster_URL") or omdb_raw.get("Poster")
+                    # --- Enrichment (Combined logic) ---
+                    enriched_movie = movie.copy()
                 
-                # 2. Ratings
-                from cineman.schemas import MovieRatings
-                ratings_obj = MovieRatings()
-                ratings_obj.imdb_rating = omdb_raw.get("imdbRating") or omdb_raw.get("IMDb_Rating")
-                ratings_obj.rt_tomatometer = omdb_raw.get("Rotten_Tomatoes")
-                if not ratings_obj.rt_tomatometer and isinstance(omdb_raw.get("Ratings"), list):
-                    for r in omdb_raw["Ratings"]:
-                        if "Rotten Tomatoes" in r.get("Source", ""):
-                             ratings_obj.rt_tomatometer = r.get("Value")
+                    # 1. Poster URL
+                    enriched_movie["poster_url"] = result.poster_url
                 
-                if tmdb_raw.get("vote_average"):
-                    try:
-                        ratings_obj.tmdb_rating = float(tmdb_raw["vote_average"])
-                    except (TypeError, ValueError) as parse_err:
-                        logger.debug(f"Failed to parse TMDB vote_average '{tmdb_raw.get('vote_average')}' as float: {parse_err}")
-                enriched_movie["ratings"] = ratings_obj.model_dump(exclude_none=True)
+                    # 2. Ratings
+                    enriched_movie["ratings"] = dict(result.ratings)
                 
-                # 3. Director & Identifiers
-                enriched_movie["director"] = result.matched_director
-                enriched_movie["identifiers"] = {
-                    "tmdb_id": tmdb_raw.get("tmdb_id") or tmdb_raw.get("id"),
-                    "imdb_id": omdb_raw.get("imdbID")
-                }
+                    # 3. Director & Identifiers
+                    enriched_movie["director"] = result.matched_director
+                    enriched_movie["identifiers"] = {
+                        "tmdb_id": result.tmdb_id,
+                        "imdb_id": result.imdb_id
+                    }
                 
-                # 4. Canonical Metadata
-                if result.matched_title: enriched_movie["title"] = result.matched_title
-                if result.matched_year: enriched_movie["year"] = result.matched_year
-
-                # 5. Streaming (Watchmode)
-                if result.watchmode_data:
-                    enriched_movie["streaming"] = result.watchmode_data.get("providers", [])
-
-                # 6. Corrections
-                if result.corrections:
-                    for field_name, corr_vals in result.corrections.items():
-                        if isinstance(corr_vals, tuple) and len(corr_vals) == 2:
-                            # Set the field to the NEW value
-                            if field_name == "original_title":
-                                # Legacy support: 'original_title' is not a field to overwrite 'title'
-                                enriched_movie["original_title"] = corr_vals[0]
+                    # 4. Canonical Metadata
+                    if result.matched_title: enriched_movie["title"] = result.matched_title
+                    if result.matched_year: enriched_movie["year"] = result.matched_year
+
+                    # 5. Streaming (Watchmode)
+                    if result.streaming_providers is not None:
+                        enriched_movie["streaming"] = result.streaming_providers
+
+                    # 6. Corrections
+                    if result.corrections:
+                        for field_name, corr_vals in result.corrections.items():
+                            if isinstance(corr_vals, tuple) and len(corr_vals) == 2:
+                                # Set the field to the NEW value
+                                if field_name == "original_title":
+                                    # Legacy support: 'original_title' is not a field to overwrite 'title'
+                                    enriched_movie["original_title"] = corr_vals[0]
+                                else:
+                                    enriched_movie[field_name] = corr_vals[1]
                             else:
-                                enriched_movie[field_name] = corr_vals[1]
-                        else:
-                            # Fallback
-                            enriched_movie[field_name] = corr_vals
-
-                if result.should_drop:
-                    dropped_movies.append({**enriched_movie, "drop_reason": result.error_message})
-                    track_validation("dropped")
-                else:
-                    valid_movies.append(enriched_movie)
-                    track_validation("corrected" if result.corrections else "valid")
+                                # Fallback
+                                enriched_movie[field_name] = corr_vals
+
+                    if result.should_drop:
+                        dropped_movies.append({**enriched_movie, "drop_reason": result.error_message})
+                        track_validation("dropped")
+                    else:
+                        valid_movies.append(enriched_movie)
+                        track_validation("corrected" if result.corrections else "valid")
                 
-                movie_validation_duration_seconds.observe(result.latency_ms / 1000.0)
-            except Exception as e:
-                logger.error(f"movie_validation_task_failed: {str(e)}, movie={movie.get('title')}")
+                    movie_validation_duration_seconds.observe(result.latency_ms / 1000.0)
+                except Exception as e:
+                    logger.error(f"movie_validation_task_failed: {str(e)}, movie={movie.get('title')}")
 
     overall_duration = (time.perf_counter() - start_all) * 1000
     avg_latency = total_latency / len(movies) if movies else 0
@@ -2,22 +2,15 @@
 Demo script showing how to use the movie data schema.
 
 This script demonstrates various use cases for the CineMan movie data schema.
+Each demo imports only the schema pieces it needs, so running a single demo
+doesn't pay for building every model.
 """
 
-from cineman.schemas import (
-    MovieRecommendation,
-    MovieRatings,
-    MovieIdentifiers,
-    MovieCredits,
-    MovieDetails,
-    parse_movie_from_api,
-    validate_llm_manifest
-)
-from pydantic import ValidationError
-
 
 def demo_basic_movie():
     """Create a basic movie with minimal required data."""
+    from cineman.schemas import MovieRecommendation
+    
     print("\n" + "="*60)
     print("1. Creating a basic movie (minimal data)")
     print("="*60)
@@ -29,13 +22,15 @@ def demo_basic_movie():
     print(f"Has ratings object: {movie.ratings is not None}")
     print(f"IMDB Rating: {movie.ratings.imdb_rating}")
     
-    # Convert to dictionary
-    print("\nAs dictionary (excluding None):")
-    print(movie.to_dict())
+    # Serialize to JSON
+    print("\nAs JSON (excluding None):")
+    print(movie.to_json())
 
 
 def demo_complete_movie():
     """Create a movie with complete data."""
+    from cineman.schemas import MovieRecommendation
+    
     print("\n" + "="*60)
     print("2. Creating a complete movie (full data)")
     print("="*60)
@@ -43,29 +38,29 @@ def demo_complete_movie():
     movie = MovieRecommendation(
         title="Inception",
         year="2010",
-        ratings=MovieRatings(
-            imdb_rating="8.8",
-            rt_tomatometer="87%",
-            rt_audience="91%",
-            tmdb_rating=8.2,
-            tmdb_vote_count=35420
-        ),
-        identifiers=MovieIdentifiers(
-            imdb_id="tt1375666",
-            tmdb_id=27205
-        ),
-        credits=MovieCredits(
-            director="Christopher Nolan",
-            writers=["Christopher Nolan"],
-            cast=["Leonardo DiCaprio", "Joseph Gordon-Levitt", "Ellen Page"]
-        ),
-        details=MovieDetails(
-            plot="A thief who steals corporate secrets through dream-sharing technology...",
-            tagline="Your mind is the scene of the crime",
-            runtime="148 min",
-            genres=["Action", "Sci-Fi", "Thriller"],
-            awards="Won 4 Oscars. 157 wins & 220 nominations total"
-        ),
+        ratings={
+            "imdb_rating": "8.8",
+            "rt_tomatometer": "87%",
+            "rt_audience": "91%",
+            "tmdb_rating": 8.2,
+            "tmdb_vote_count": 35420
+        },
+        identifiers={
+            "imdb_id": "tt1375666",
+            "tmdb_id": 27205
+        },
+        credits={
+            "director": "Christopher Nolan",
+            "writers": ["Christopher Nolan"],
+            "cast": ["Leonardo DiCaprio", "Joseph Gordon-Levitt", "Ellen Page"]
+        },
+        details={
+            "plot": "A thief who steals corporate secrets through dream-sharing technology...",
+            "tagline": "Your mind is the scene of the crime",
+            "runtime": "148 min",
+            "genres": ["Action", "Sci-Fi", "Thriller"],
+            "awards": "Won 4 Oscars. 157 wins & 220 nominations total"
+        },
         poster_url="https://image.tmdb.org/t/p/w500/example.jpg",
         anchor_id="m1",
         anchor_text="Masterpiece #1: Inception (2010)"
@@ -83,6 +78,8 @@ def demo_complete_movie():
 
 def demo_dict_creation():
     """Create a movie from dictionary (simulating API response)."""
+    from cineman.schemas import MovieRecommendation, MovieRatings
+    
     print("\n" + "="*60)
     print("3. Creating movie from dictionary (auto-conversion)")
     print("="*60)
@@ -113,6 +110,9 @@ def demo_dict_creation():
 
 def demo_validation():
     """Show validation in action."""
+    from pydantic import ValidationError
+    from cineman.schemas import MovieRecommendation
+    
     print("\n" + "="*60)
     print("4. Schema validation (catching errors)")
     print("="*60)
@@ -151,6 +151,8 @@ def demo_validation():
 
 def demo_api_parsing():
     """Parse movie data from API response."""
+    from cineman.schemas import parse_movie_from_api
+    
     print("\n" + "="*60)
     print("5. Parsing API response (combined TMDB + OMDb)")
     print("="*60)
@@ -188,6 +190,8 @@ def demo_api_parsing():
 
 def demo_llm_manifest():
     """Validate LLM manifest with multiple movies."""
+    from cineman.schemas import validate_llm_manifest
+    
     print("\n" + "="*60)
     print("6. Validating LLM manifest (multiple movies)")
     print("="*60)
@@ -228,6 +232,8 @@ def demo_llm_manifest():
 
 def demo_legacy_format():
     """Convert to legacy format for backward compatibility."""
+    from cineman.schemas import MovieRecommendation
+    
     print("\n" + "="*60)
     print("7. Converting to legacy format (backward compatibility)")
     print("="*60)
@@ -235,11 +241,11 @@ def demo_legacy_format():
     movie = MovieRecommendation(
         title="Inception",
         year="2010",
-        ratings=MovieRatings(
-            imdb_rating="8.8",
-            rt_tomatometer="87%"
-        ),
-        identifiers=MovieIdentifiers(imdb_id="tt1375666"),
+        ratings={
+            "imdb_rating": "8.8",
+            "rt_tomatometer": "87%"
+        },
+        identifiers={"imdb_id": "tt1375666"},
         anchor_id="m1"
     )
     
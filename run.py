@@ -3,17 +3,13 @@
 Main entry point for running the Cineman Flask application.
 """
 
-import os
 from dotenv import load_dotenv
 
 # Load environment variables first
 load_dotenv()
 
-from cineman.app import app, init_db
+from cineman.app import run_dev_server
 
 if __name__ == '__main__':
-    # Initialize database tables on startup
-    init_db()
-    port = int(os.getenv('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=True)
+    run_dev_server()
 
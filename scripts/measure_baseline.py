@@ -2,32 +2,47 @@ import requests
 import time
 import json
 import statistics
+from concurrent.futures import ThreadPoolExecutor
 
-def measure_chat_performance(prompt, num_runs=3):
-    url = "http://localhost:5002/chat"
+BASE_URL = "http://localhost:5002"
+
+
+def _timed_post(session, url, payload):
+    """POST payload and return (response, duration_s), or (exception, duration_s) on failure."""
+    start_time = time.perf_counter()
+    try:
+        response = session.post(url, json=payload)
+    except Exception as e:
+        return e, time.perf_counter() - start_time
+    return response, time.perf_counter() - start_time
+
+
+def measure_chat_performance(prompt, num_runs=3, session=None):
+    url = f"{BASE_URL}/chat"
     total_times = []
-    
+    session = session or requests.Session()
+
     print(f"Measuring performance for prompt: '{prompt}'")
-    print(f"Running {num_runs} iterations...\n")
-    
-    for i in range(num_runs):
-        start_time = time.time()
-        try:
-            response = requests.post(url, json={"message": prompt})
-            duration = time.time() - start_time
-            
-            if response.status_code == 200:
-                data = response.json()
-                movies_count = len(data.get("movies", []))
-                validation = data.get("validation", {})
-                
-                print(f"Run {i+1}: {duration:.2f}s | Movies: {movies_count} | Avg Val Latency: {validation.get('avg_latency_ms', 0):.0f}ms")
-                total_times.append(duration)
-            else:
-                print(f"Run {i+1}: Error {response.status_code} - {response.text}")
-        except Exception as e:
-            print(f"Run {i+1}: Exception: {e}")
-            
+    print(f"Running {num_runs} iterations concurrently...\n")
+
+    # Fire all runs at once over one pooled session; each run is timed on its own thread.
+    with ThreadPoolExecutor(max_workers=num_runs) as executor:
+        futures = [executor.submit(_timed_post, session, url, {"message": prompt}) for _ in range(num_runs)]
+        results = [future.result() for future in futures]
+
+    for i, (response, duration) in enumerate(results):
+        if isinstance(response, Exception):
+            print(f"Run {i+1}: Exception: {response}")
+        elif response.status_code == 200:
+            data = response.json()
+            movies_count = len(data.get("movies", []))
+            validation = data.get("validation", {})
+
+            print(f"Run {i+1}: {duration:.2f}s | Movies: {movies_count} | Avg Val Latency: {validation.get('avg_latency_ms', 0):.0f}ms")
+            total_times.append(duration)
+        else:
+            print(f"Run {i+1}: Error {response.status_code} - {response.text}")
+
     if total_times:
         avg_time = statistics.mean(total_times)
         min_time = min(total_times)
@@ -40,12 +55,13 @@ def measure_chat_performance(prompt, num_runs=3):
     return None
 
 if __name__ == "__main__":
+    session = requests.Session()
     # Ensure the server is running or tell user to run it
     try:
-        requests.get("http://localhost:5002/health")
+        session.get(f"{BASE_URL}/health")
     except:
-        print("Error: Cineman server is not running on http://localhost:5002")
+        print(f"Error: Cineman server is not running on {BASE_URL}")
         print("Please start it with 'python3 run.py' in a separate terminal.")
         exit(1)
-        
-    measure_chat_performance("I want to watch three sci-fi movies like Interstellar", num_runs=3)
+
+    measure_chat_performance("I want to watch three sci-fi movies like Interstellar", num_runs=3, session=session)
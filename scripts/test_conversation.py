@@ -7,6 +7,9 @@ Usage: python scripts/test_conversation.py
 """
 import os
 import sys
+import threading
+from collections import deque
+import traceback
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -14,6 +17,9 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from cineman.chain import get_recommendation_chain, format_chat_history
 from cineman.session_manager import SessionManager
 
+# Number of recent messages passed to the LLM as chat history
+RECENT_HISTORY_SIZE = 6
+
 
 def print_banner():
     """Print welcome banner."""
@@ -50,15 +56,24 @@ def main():
         print("Please set it with: export GEMINI_API_KEY=your_key")
         sys.exit(1)
     
+    # Build the chain (Gemini client, prompt, structured-output schema) in the
+    # background while the banner is shown; the result is cached.
+    warmup = threading.Thread(target=get_recommendation_chain, daemon=True)
+    warmup.start()
+    
     print_banner()
     
     try:
         # Initialize chain and session
         print("⏳ Initializing CineMan...")
+        warmup.join()
         chain = get_recommendation_chain()
         session_manager = SessionManager()
         session_id = session_manager.create_session()
         session_data = session_manager.get_session(session_id)
+        # Only the last few turns are sent to the LLM; keep them in a bounded
+        # deque instead of slicing the full session history every turn.
+        recent_history = deque(maxlen=RECENT_HISTORY_SIZE)
         print("✅ Ready to chat!\n")
         
         while True:
@@ -81,6 +96,7 @@ def main():
                 # Start new session
                 session_id = session_manager.create_session()
                 session_data = session_manager.get_session(session_id)
+                recent_history.clear()
                 print("\n✨ Started a new session! Previous conversation cleared.")
                 continue
             
@@ -112,8 +128,7 @@ def main():
             print("\n⏳ CineMan is thinking...")
             
             # Format chat history
-            chat_history = session_data.get_chat_history()
-            formatted_history = format_chat_history(chat_history[-6:])
+            formatted_history = format_chat_history(recent_history)
             
             try:
                 # Get response from LLM
@@ -122,39 +137,33 @@ def main():
                     "chat_history": formatted_history
                 })
                 
+                # The chain returns a structured ChatResponse, so the movie
+                # manifest is already parsed - no JSON scraping needed.
+                response_text = response.response_text
+                
                 # Add to session
                 session_data.add_message("user", user_input)
-                session_data.add_message("assistant", response)
+                session_data.add_message("assistant", response_text)
+                recent_history.append({"role": "user", "content": user_input})
+                recent_history.append({"role": "assistant", "content": response_text})
                 
-                # Extract and track movies if present
-                if '{"movies":' in response or '"movies":' in response:
-                    # Try to extract movie titles
-                    import json
-                    try:
-                        json_start = response.rfind('{')
-                        if json_start != -1:
-                            json_str = response[json_start:].strip()
-                            manifest = json.loads(json_str)
-                            if 'movies' in manifest:
-                                movie_titles = [m.get('title', '') for m in manifest['movies'] if m.get('title')]
-                                session_data.add_recommended_movies(movie_titles)
-                                print(f"📌 Added {len(movie_titles)} movies to tracking")
-                    except:
-                        pass
+                # Track recommended movies
+                movie_titles = [m.title for m in response.movies if m.title]
+                if movie_titles:
+                    session_data.add_recommended_movies(movie_titles)
+                    print(f"📌 Added {len(movie_titles)} movies to tracking")
                 
                 # Print response
-                print_message("assistant", response)
+                print_message("assistant", response_text)
                 
             except Exception as e:
                 print(f"\n❌ Error getting response: {e}")
-                import traceback
                 traceback.print_exc()
     
     except KeyboardInterrupt:
         print("\n\nInterrupted. Goodbye! 👋")
     except Exception as e:
         print(f"\n❌ Fatal error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
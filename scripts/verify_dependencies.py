@@ -7,8 +7,9 @@ Verifies that all required packages from requirements.txt are installed and impo
 import sys
 import re
 import importlib
+from importlib import metadata
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 
 # Color codes for terminal output
 class Colors:
@@ -19,6 +20,16 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Per-package result lines, formatted with % in the verification loop
+_OK_FMT = f"{Colors.GREEN}✅ %s%s{Colors.END}"
+_FAIL_FMT = f"{Colors.RED}❌ %s - %s{Colors.END}"
+
+# Requirement line: package name (with optional extras) followed by the version specifier.
+# Handles formats like: package>=1.0.0, package==1.0.0, package~=1.0.0, etc.
+_REQ_RE = re.compile(r'^([a-zA-Z0-9_-]+(?:\[[^\]]+\])?)(.*)$')
+_EXTRAS_RE = re.compile(r'\[.*\]')
+_NAME_SEP_RE = re.compile(r'[-_.]+')
+
 def parse_requirements_file(requirements_path: str) -> List[Tuple[str, str]]:
     """
     Parse requirements.txt and extract package names and version specifiers.
@@ -31,29 +42,26 @@ def parse_requirements_file(requirements_path: str) -> List[Tuple[str, str]]:
         print(f"{Colors.RED}❌ Error: {requirements_path} not found!{Colors.END}")
         sys.exit(1)
     
-    with open(requirements_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
+    lines = requirements_file.read_text(encoding='utf-8').splitlines()
+    
+    for line in lines:
+        # Remove comments (whole-line and inline)
+        line = line.partition('#')[0].strip()
+        
+        # Skip empty lines
+        if not line:
+            continue
+        
+        # Parse package name and version specifier
+        match = _REQ_RE.match(line)
+        if match:
+            package_name = match.group(1)
+            version_spec = match.group(2).strip() if match.group(2) else ""
             
-            # Remove inline comments
-            if '#' in line:
-                line = line[:line.index('#')].strip()
+            # Remove extras (e.g., package[extra] -> package)
+            package_name = _EXTRAS_RE.sub('', package_name)
             
-            # Parse package name and version specifier
-            # Handles formats like: package>=1.0.0, package==1.0.0, package~=1.0.0, etc.
-            match = re.match(r'^([a-zA-Z0-9_-]+(?:\[[^\]]+\])?)(.*)$', line)
-            if match:
-                package_name = match.group(1)
-                version_spec = match.group(2).strip() if match.group(2) else ""
-                
-                # Remove extras (e.g., package[extra] -> package)
-                package_name = re.sub(r'\[.*\]', '', package_name)
-                
-                requirements.append((package_name, version_spec))
+            requirements.append((package_name, version_spec))
     
     return requirements
 
@@ -73,31 +81,38 @@ def get_import_name(package_name: str) -> str:
     
     return mappings.get(package_name, package_name.replace('-', '_'))
 
-def check_package(package_name: str, import_name: str) -> Tuple[bool, str, str]:
+def normalize_name(name: str) -> str:
+    """
+    Normalize a distribution name per PEP 503 (e.g., 'Flask_SQLAlchemy' -> 'flask-sqlalchemy').
+    """
+    return _NAME_SEP_RE.sub('-', name).lower()
+
+def get_installed_versions() -> Dict[str, str]:
+    """
+    Snapshot all installed distributions in one pass.
+    Returns a dict of normalized distribution name -> version.
+    """
+    versions = {}
+    for dist in metadata.distributions():
+        name = dist.metadata['Name']
+        if name:
+            versions.setdefault(normalize_name(name), dist.version)
+    return versions
+
+def check_package(package_name: str, import_name: str,
+                  versions: Optional[Dict[str, str]] = None) -> Tuple[bool, str, str]:
     """
     Check if a package can be imported and get its version.
+    Versions are looked up in `versions` (see get_installed_versions); a fresh
+    snapshot is taken if none is given.
     Returns: (success, version, error_message)
     """
     try:
-        module = importlib.import_module(import_name)
+        importlib.import_module(import_name)
         
-        # Try to get version using importlib.metadata first (preferred method)
-        version = "unknown"
-        try:
-            from importlib import metadata
-            version = metadata.version(package_name)
-        except (ImportError, Exception):
-            # Fallback to pkg_resources
-            try:
-                import pkg_resources
-                version = pkg_resources.get_distribution(package_name).version
-            except (ImportError, Exception):
-                # Last resort: try module attributes
-                version_attrs = ['__version__', 'version', 'VERSION', '__VERSION__']
-                for attr in version_attrs:
-                    if hasattr(module, attr):
-                        version = str(getattr(module, attr))
-                        break
+        if versions is None:
+            versions = get_installed_versions()
+        version = versions.get(normalize_name(package_name), "unknown")
         
         return (True, version, "")
     
@@ -126,9 +141,11 @@ def verify_dependencies(requirements_path: str = "requirements.txt") -> Dict:
         "details": []
     }
     
+    versions = get_installed_versions()
+    
     for package_name, version_spec in requirements:
         import_name = get_import_name(package_name)
-        success, version, error = check_package(package_name, import_name)
+        success, version, error = check_package(package_name, import_name, versions)
         
         result_entry = {
             "package": package_name,
@@ -144,10 +161,10 @@ def verify_dependencies(requirements_path: str = "requirements.txt") -> Dict:
         if success:
             results["installed"] += 1
             version_display = f" (v{version})" if version != "unknown" else ""
-            print(f"{Colors.GREEN}✅ {package_name}{version_display}{Colors.END}")
+            print(_OK_FMT % (package_name, version_display))
         else:
             results["missing"] += 1
-            print(f"{Colors.RED}❌ {package_name} - {error}{Colors.END}")
+            print(_FAIL_FMT % (package_name, error))
     
     return results
 
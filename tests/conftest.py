@@ -1,11 +1,37 @@
 
 import pytest
+import atexit
 import os
 import sys
+import tempfile
+from contextlib import contextmanager
+
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+# Make the cineman package importable however the tests are invoked
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+# The database URI is read when cineman.app is imported (db.init_app runs at
+# import time), so point the suite at a throwaway SQLite file beforehand
+_DB_FD, _DB_PATH = tempfile.mkstemp(prefix='cineman-test-', suffix='.db')
+os.close(_DB_FD)
+atexit.register(os.remove, _DB_PATH)
+os.environ['DATABASE_URL'] = 'sqlite:///' + _DB_PATH
+
 from cineman.app import app
 from cineman.models import db
 from cineman.cache import get_cache, reset_global_cache
 
+# Test configuration, applied once when the test session starts
+TEST_CONFIG = {
+    'TESTING': True,
+    'SECRET_KEY': 'test-secret-key',
+}
+app.config.update(TEST_CONFIG)
+
 @pytest.fixture(autouse=True)
 def clean_env():
     """Ensure clean environment state for every test."""
@@ -16,18 +42,115 @@ def clean_env():
     
     reset_global_cache()
 
-@pytest.fixture(scope='function')
-def test_app():
-    """Create a fresh Flask app context for each test."""
-    app.config['TESTING'] = True
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+def _ensure_schema():
+    """Create any missing tables (a no-op when the schema is already in place)."""
+    # unittest modules that call drop_all() in tearDown remove the shared tables
+    db.create_all()
+
+def _enable_sqlite_savepoints(engine):
+    """
+    Let SQLAlchemy emit BEGIN itself on SQLite.
+    
+    pysqlite defers BEGIN until the first write, so an outer transaction held
+    by a test would not exist and a released SAVEPOINT would really commit.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+    
+    # Pooled connections were opened before the listeners existed
+    engine.dispose()
+
+class _ConnectionSession(Session):
+    """Flask-SQLAlchemy session that always uses the connection it was bound to."""
+    
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        # The default looks the engine up per model, bypassing the connection
+        return self.bind
+
+@contextmanager
+def _rolled_back_session(flask_app):
+    """
+    Run the block with db.session bound to one connection whose transaction
+    is rolled back afterwards.
+    
+    Commits made by route handlers only release SAVEPOINTs inside that
+    transaction, so the test's rows are discarded without any DELETE or DDL.
+    """
+    with flask_app.app_context():
+        _ensure_schema()
+        connection = db.engine.connect()
+    transaction = connection.begin()
+    original_session = db.session
+    db.session = db._make_scoped_session({
+        "class_": _ConnectionSession,
+        "bind": connection,
+        "join_transaction_mode": "create_savepoint",
+    })
+    try:
+        yield
+    finally:
+        with flask_app.app_context():
+            db.session.remove()
+        db.session = original_session
+        transaction.rollback()
+        connection.close()
+
+@pytest.fixture(scope='session')
+def flask_app():
+    """The Flask app, with the database schema created once per session."""
+    with app.app_context():
+        _enable_sqlite_savepoints(db.engine)
+        _ensure_schema()
+    
+    yield app
     
     with app.app_context():
-        db.create_all()
-        yield app
         db.session.remove()
         db.drop_all()
 
+@pytest.fixture
+def test_app(flask_app):
+    """The Flask app inside an app context, sharing the session's schema."""
+    with _rolled_back_session(flask_app), flask_app.app_context():
+        yield flask_app
+
+@pytest.fixture
+def client(flask_app):
+    """
+    Test client for the shared app.
+    
+    The test runs inside a transaction that is rolled back afterwards, which
+    keeps the schema and is far cheaper than dropping and recreating the
+    tables around every test.
+    """
+    with _rolled_back_session(flask_app):
+        yield flask_app.test_client()
+
+class FakeClock:
+    """Manually advanced nanosecond clock for MovieCache(clock=...)."""
+    
+    def __init__(self, start_seconds=1000):
+        self.now_ns = start_seconds * 1_000_000_000
+    
+    def __call__(self):
+        return self.now_ns
+    
+    def advance(self, seconds):
+        self.now_ns += int(seconds * 1_000_000_000)
+
+@pytest.fixture
+def fake_clock():
+    """A FakeClock for expiring cache entries without sleeping."""
+    return FakeClock()
+
 @pytest.fixture(autouse=True)
 def clear_cache_content():
     """Clear cache content automatically for every test."""
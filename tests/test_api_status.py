@@ -8,159 +8,162 @@ Tests the health check functionality for external APIs:
 """
 
 import unittest
-from unittest.mock import patch, MagicMock
-import os
-import sys
+from unittest.mock import Mock, patch
+import threading
+import time
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
 
 from cineman.api_status import (
     check_gemini_status,
     check_tmdb_status,
     check_omdb_status,
-    check_all_apis
+    check_all_apis,
+    check_status,
+    clear_status_cache,
+    refresh_api_keys,
+    STATUS_CHECKS,
+    STATUS_CHECK_TIMEOUT,
+    PROBE_TIMEOUT,
+    _SESSION
 )
 
 
-class TestAPIStatusChecker(unittest.TestCase):
-    """Test cases for API status checker functions."""
+class FakeResp:
+    """Minimal stand-in for requests.Response; the checks only read these."""
+    __slots__ = ('status_code', '_json')
     
-    @patch('cineman.api_status.requests.get')
-    @patch.dict(os.environ, {'GEMINI_API_KEY': 'test-key'})
-    def test_gemini_operational(self, mock_get):
-        """Test Gemini API status when operational."""
-        # Mock successful response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
-        
-        result = check_gemini_status()
-        
-        self.assertEqual(result['status'], 'operational')
-        self.assertEqual(result['message'], 'API is operational')
-        self.assertIn('response_time', result)
-        self.assertGreaterEqual(result['response_time'], 0)
+    def __init__(self, status_code, json_data=None):
+        self.status_code = status_code
+        self._json = json_data
     
-    @patch('cineman.api_status.requests.get')
-    @patch.dict(os.environ, {'GEMINI_API_KEY': 'invalid-key'})
-    def test_gemini_invalid_key(self, mock_get):
-        """Test Gemini API status with invalid key."""
-        # Mock 403 Forbidden response
-        mock_response = MagicMock()
-        mock_response.status_code = 403
-        mock_get.return_value = mock_response
-        
-        result = check_gemini_status()
-        
-        self.assertEqual(result['status'], 'error')
-        self.assertEqual(result['message'], 'Invalid API key')
+    def json(self):
+        return self._json
+
+
+# (service, env var, operational response, invalid-key response, probe URL fragment)
+SERVICES = [
+    ('gemini', 'GEMINI_API_KEY', FakeResp(200), FakeResp(403), 'pageSize=1'),
+    ('tmdb', 'TMDB_API_KEY', FakeResp(200), FakeResp(401), '/3/authentication'),
+    ('omdb', 'OMDB_API_KEY', FakeResp(200, {'Response': 'True'}),
+     FakeResp(200, {'Response': 'False', 'Error': 'Invalid API key!'}), 'i=tt0111161'),
+]
+
+
+@pytest.fixture
+def set_api_key(monkeypatch):
+    """Set (or with None, unset) an API key and reload the keys api_status uses."""
+    def set_key(env_var, value):
+        if value is None:
+            monkeypatch.delenv(env_var, raising=False)
+        else:
+            monkeypatch.setenv(env_var, value)
+        refresh_api_keys()
     
-    @patch.dict(os.environ, {}, clear=True)
-    def test_gemini_no_key(self):
-        """Test Gemini API status when key is not configured."""
-        result = check_gemini_status()
-        
-        self.assertEqual(result['status'], 'error')
-        self.assertEqual(result['message'], 'API key not configured')
-        self.assertEqual(result['response_time'], 0)
+    yield set_key
+    monkeypatch.undo()
+    refresh_api_keys()
+
+
+@pytest.mark.parametrize("service,env_var,ok_response,bad_key_response,url_part", SERVICES)
+class TestServiceStatus:
+    """Test cases shared by the Gemini, TMDB and OMDB status checks."""
     
-    @patch('cineman.api_status.requests.get')
-    @patch.dict(os.environ, {'GEMINI_API_KEY': 'test-key'})
-    def test_gemini_timeout(self, mock_get):
-        """Test Gemini API status with timeout."""
-        # Mock timeout
-        mock_get.side_effect = Exception('Timeout')
+    def test_operational(self, set_api_key, service, env_var, ok_response, bad_key_response, url_part):
+        """Test a service reports operational on a good response."""
+        set_api_key(env_var, 'test-key')
+        with patch('cineman.api_status._SESSION.get', return_value=ok_response) as mock_get:
+            result = check_status(service)
         
-        result = check_gemini_status()
+        assert result['status'] == 'operational'
+        assert result['message'] == 'API is operational'
+        assert isinstance(result['response_time'], int)
+        assert result['response_time'] >= 0
+        # Probes use the small-body endpoints
+        assert url_part in mock_get.call_args[0][0]
+    
+    def test_invalid_key(self, set_api_key, service, env_var, ok_response, bad_key_response, url_part):
+        """Test a rejected key is reported as an error."""
+        set_api_key(env_var, 'invalid-key')
+        with patch('cineman.api_status._SESSION.get', return_value=bad_key_response):
+            result = check_status(service)
         
-        self.assertEqual(result['status'], 'error')
-        self.assertEqual(result['message'], 'Connection failed')
+        assert result['status'] == 'error'
+        assert result['message'] == 'Invalid API key'
     
-    @patch('cineman.api_status.requests.get')
-    @patch.dict(os.environ, {'TMDB_API_KEY': 'test-key'})
-    def test_tmdb_operational(self, mock_get):
-        """Test TMDB API status when operational."""
-        # Mock successful response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
-        
-        result = check_tmdb_status()
-        
-        self.assertEqual(result['status'], 'operational')
-        self.assertEqual(result['message'], 'API is operational')
-        self.assertIn('response_time', result)
+    def test_no_key(self, set_api_key, service, env_var, ok_response, bad_key_response, url_part):
+        """Test a missing key is reported without probing the service."""
+        set_api_key(env_var, None)
+        with patch('cineman.api_status._SESSION.get') as mock_get:
+            result = check_status(service)
+        
+        assert result['status'] == 'error'
+        assert result['message'] == 'API key not configured'
+        assert result['response_time'] == 0
+        mock_get.assert_not_called()
     
-    @patch('cineman.api_status.requests.get')
-    @patch.dict(os.environ, {'TMDB_API_KEY': 'invalid-key'})
-    def test_tmdb_invalid_key(self, mock_get):
-        """Test TMDB API status with invalid key."""
-        # Mock 401 Unauthorized response
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_get.return_value = mock_response
-        
-        result = check_tmdb_status()
-        
-        self.assertEqual(result['status'], 'error')
-        self.assertEqual(result['message'], 'Invalid API key')
+    def test_no_key_result_shared(self, set_api_key, service, env_var, ok_response, bad_key_response, url_part):
+        """Test the missing-key result is one shared, read-only object."""
+        set_api_key(env_var, None)
+        result = check_status(service)
+        
+        assert check_status(service) is result
+        with pytest.raises(TypeError):
+            result['status'] = 'operational'
     
-    @patch.dict(os.environ, {}, clear=True)
-    def test_tmdb_no_key(self):
-        """Test TMDB API status when key is not configured."""
-        result = check_tmdb_status()
+    def test_connection_failed(self, set_api_key, service, env_var, ok_response, bad_key_response, url_part):
+        """Test a probe that raises is reported as a connection failure."""
+        set_api_key(env_var, 'test-key')
+        with patch('cineman.api_status._SESSION.get', side_effect=Exception('Timeout')):
+            result = check_status(service)
         
-        self.assertEqual(result['status'], 'error')
-        self.assertEqual(result['message'], 'API key not configured')
+        assert result['status'] == 'error'
+        assert result['message'] == 'Connection failed'
+
+
+def test_status_checks_table():
+    """Test the dispatch table covers every service in report order."""
+    assert STATUS_CHECKS == {
+        'gemini': check_gemini_status,
+        'tmdb': check_tmdb_status,
+        'omdb': check_omdb_status
+    }
+    assert list(STATUS_CHECKS) == ['gemini', 'tmdb', 'omdb']
+
+
+def test_probe_fits_within_check_timeout():
+    """Test a probe makes one attempt that ends before the aggregate timeout."""
+    adapter = _SESSION.get_adapter('https://api.themoviedb.org/3/authentication')
     
-    @patch('cineman.api_status.requests.get')
-    @patch.dict(os.environ, {'OMDB_API_KEY': 'test-key'})
-    def test_omdb_operational(self, mock_get):
-        """Test OMDB API status when operational."""
-        # Mock successful response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'Response': 'True'}
-        mock_get.return_value = mock_response
-        
-        result = check_omdb_status()
-        
-        self.assertEqual(result['status'], 'operational')
-        self.assertEqual(result['message'], 'API is operational')
-        self.assertIn('response_time', result)
+    assert adapter.max_retries.total == 0
+    assert sum(PROBE_TIMEOUT) < STATUS_CHECK_TIMEOUT
+
+
+def test_check_status_unknown_service():
+    """Test that an unknown service name is rejected."""
+    with pytest.raises(ValueError):
+        check_status('imdb')
+
+
+class TestAPIStatusChecker(unittest.TestCase):
+    """Test cases for API status checker functions."""
     
-    @patch('cineman.api_status.requests.get')
-    @patch.dict(os.environ, {'OMDB_API_KEY': 'invalid-key'})
-    def test_omdb_invalid_key(self, mock_get):
-        """Test OMDB API status with invalid key."""
-        # Mock invalid key response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'Response': 'False',
-            'Error': 'Invalid API key!'
-        }
-        mock_get.return_value = mock_response
-        
-        result = check_omdb_status()
-        
-        self.assertEqual(result['status'], 'error')
-        self.assertEqual(result['message'], 'Invalid API key')
+    def setUp(self):
+        """Start every test without a cached status check."""
+        clear_status_cache()
+        self.addCleanup(clear_status_cache)
     
-    @patch.dict(os.environ, {}, clear=True)
-    def test_omdb_no_key(self):
-        """Test OMDB API status when key is not configured."""
-        result = check_omdb_status()
-        
-        self.assertEqual(result['status'], 'error')
-        self.assertEqual(result['message'], 'API key not configured')
+    def patch_checks(self):
+        """Replace the status checks with mocks, returned as (gemini, tmdb, omdb)."""
+        mocks = {name: Mock() for name in STATUS_CHECKS}
+        patcher = patch.dict('cineman.api_status.STATUS_CHECKS', mocks)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return mocks['gemini'], mocks['tmdb'], mocks['omdb']
     
-    @patch('cineman.api_status.check_gemini_status')
-    @patch('cineman.api_status.check_tmdb_status')
-    @patch('cineman.api_status.check_omdb_status')
-    def test_check_all_apis(self, mock_omdb, mock_tmdb, mock_gemini):
+    def test_check_all_apis(self):
         """Test checking all APIs at once."""
+        mock_gemini, mock_tmdb, mock_omdb = self.patch_checks()
         # Mock responses
         mock_gemini.return_value = {
             'status': 'operational',
@@ -187,11 +190,9 @@ class TestAPIStatusChecker(unittest.TestCase):
         self.assertEqual(result['tmdb']['status'], 'operational')
         self.assertEqual(result['omdb']['status'], 'operational')
     
-    @patch('cineman.api_status.check_gemini_status')
-    @patch('cineman.api_status.check_tmdb_status')
-    @patch('cineman.api_status.check_omdb_status')
-    def test_check_all_apis_mixed_status(self, mock_omdb, mock_tmdb, mock_gemini):
+    def test_check_all_apis_mixed_status(self):
         """Test checking all APIs with mixed statuses."""
+        mock_gemini, mock_tmdb, mock_omdb = self.patch_checks()
         # Mock mixed responses
         mock_gemini.return_value = {
             'status': 'operational',
@@ -215,6 +216,153 @@ class TestAPIStatusChecker(unittest.TestCase):
         self.assertEqual(result['tmdb']['status'], 'degraded')
         self.assertEqual(result['omdb']['status'], 'error')
 
+    
+    def test_check_all_apis_runs_in_parallel(self):
+        """Test that all three checks are in flight at the same time."""
+        mock_gemini, mock_tmdb, mock_omdb = self.patch_checks()
+        # Each check blocks until all three have started; run serially, the
+        # barrier would time out and the check would raise.
+        barrier = threading.Barrier(3, timeout=2)
+        
+        def operational():
+            barrier.wait()
+            return {
+                'status': 'operational',
+                'message': 'API is operational',
+                'response_time': 100
+            }
+        
+        mock_gemini.side_effect = operational
+        mock_tmdb.side_effect = operational
+        mock_omdb.side_effect = operational
+        
+        result = check_all_apis()
+        
+        self.assertEqual(list(result), ['gemini', 'tmdb', 'omdb'])
+        for service in result.values():
+            self.assertEqual(service['status'], 'operational')
+    
+    def test_check_all_apis_isolates_failing_check(self):
+        """Test that one failing check does not fail the aggregate."""
+        mock_gemini, mock_tmdb, mock_omdb = self.patch_checks()
+        mock_gemini.return_value = {
+            'status': 'operational',
+            'message': 'API is operational',
+            'response_time': 100
+        }
+        mock_tmdb.side_effect = RuntimeError('boom')
+        mock_omdb.return_value = {
+            'status': 'operational',
+            'message': 'API is operational',
+            'response_time': 200
+        }
+        
+        result = check_all_apis()
+        
+        self.assertEqual(result['gemini']['status'], 'operational')
+        self.assertEqual(result['tmdb']['status'], 'error')
+        self.assertEqual(result['tmdb']['message'], 'Connection failed')
+        self.assertEqual(result['omdb']['status'], 'operational')
+    
+    def test_check_all_apis_returns_when_checks_finish(self):
+        """Test that fast checks are collected without any fixed wait."""
+        def fast():
+            time.sleep(0.005)
+            return {
+                'status': 'operational',
+                'message': 'API is operational',
+                'response_time': 5
+            }
+        
+        for mock_check in self.patch_checks():
+            mock_check.side_effect = fast
+        
+        start = time.monotonic()
+        check_all_apis()
+        self.assertLess(time.monotonic() - start, 0.05)
+    
+    def test_check_all_apis_reports_unfinished_check(self):
+        """Test that a check still running at the timeout is reported as degraded."""
+        mock_gemini, mock_tmdb, mock_omdb = self.patch_checks()
+        release = threading.Event()
+        self.addCleanup(release.set)
+        
+        operational = {
+            'status': 'operational',
+            'message': 'API is operational',
+            'response_time': 100
+        }
+        mock_gemini.return_value = operational
+        mock_tmdb.side_effect = lambda: release.wait(timeout=2) and operational
+        mock_omdb.return_value = operational
+        
+        with patch('cineman.api_status.STATUS_CHECK_TIMEOUT', 0.1):
+            result = check_all_apis()
+        
+        self.assertEqual(result['gemini']['status'], 'operational')
+        self.assertEqual(result['tmdb']['status'], 'degraded')
+        self.assertEqual(result['tmdb']['message'], 'Request timeout')
+        self.assertEqual(result['omdb']['status'], 'operational')
+
+    
+    @patch('cineman.api_status._probe_all_apis')
+    def test_check_all_apis_cached(self, mock_probe):
+        """Test that repeated checks within the TTL probe only once."""
+        mock_probe.return_value = {
+            'gemini': {'status': 'operational', 'message': 'API is operational', 'response_time': 100}
+        }
+        
+        first = check_all_apis()
+        second = check_all_apis()
+        
+        self.assertEqual(first, second)
+        self.assertEqual(mock_probe.call_count, 1)
+        
+        check_all_apis(force_refresh=True)
+        self.assertEqual(mock_probe.call_count, 2)
+    
+    @patch('cineman.api_status._probe_all_apis')
+    def test_check_all_apis_cache_expires(self, mock_probe):
+        """Test that an expired result is probed again."""
+        mock_probe.return_value = {
+            'gemini': {'status': 'operational', 'message': 'API is operational', 'response_time': 100}
+        }
+        
+        with patch('cineman.api_status.STATUS_CACHE_TTL', 0):
+            check_all_apis()
+            check_all_apis()
+        
+        self.assertEqual(mock_probe.call_count, 2)
+
+    
+    @patch('cineman.api_status._probe_all_apis')
+    def test_concurrent_checks_share_one_probe(self, mock_probe):
+        """Test that concurrent callers on a cold cache trigger a single probe."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        started = threading.Event()
+        release = threading.Event()
+        
+        def slow_probe():
+            started.set()
+            release.wait(timeout=2)
+            return {
+                'gemini': {'status': 'operational', 'message': 'API is operational', 'response_time': 100}
+            }
+        
+        mock_probe.side_effect = slow_probe
+        
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            first = executor.submit(check_all_apis)
+            started.wait(timeout=2)
+            others = [executor.submit(check_all_apis) for _ in range(4)]
+            release.set()
+            results = [first.result()] + [f.result() for f in others]
+        
+        self.assertEqual(mock_probe.call_count, 1)
+        for result in results:
+            self.assertEqual(result['gemini']['status'], 'operational')
+
 
 class TestAPIStatusEndpoint(unittest.TestCase):
     """Test cases for the API status endpoint."""
@@ -224,7 +372,6 @@ class TestAPIStatusEndpoint(unittest.TestCase):
         from cineman.app import app
         self.app = app
         self.client = self.app.test_client()
-        self.app.config['TESTING'] = True
     
     @patch('cineman.routes.api.check_all_apis')
     def test_status_endpoint_success(self, mock_check):
@@ -259,17 +406,88 @@ class TestAPIStatusEndpoint(unittest.TestCase):
         self.assertIn('tmdb', data['services'])
         self.assertIn('omdb', data['services'])
     
+    @patch('cineman.routes.api.check_all_apis')
+    def test_status_endpoint_304_on_match(self, mock_check):
+        """Test /api/status answers a matching If-None-Match with an empty 304."""
+        mock_check.return_value = {
+            'gemini': {'status': 'operational', 'message': 'API is operational', 'response_time': 100}
+        }
+        
+        first = self.client.get('/api/status')
+        etag = first.headers['ETag']
+        self.assertIn('must-revalidate', first.headers['Cache-Control'])
+        
+        second = self.client.get('/api/status', headers={'If-None-Match': etag})
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.data, b'')
+        self.assertEqual(second.headers['ETag'], etag)
+    
+    @patch('cineman.routes.api.check_all_apis')
+    def test_status_endpoint_304_ignores_response_time(self, mock_check):
+        """Test a new probe response time alone does not change the ETag."""
+        mock_check.return_value = {
+            'gemini': {'status': 'operational', 'message': 'API is operational', 'response_time': 100}
+        }
+        etag = self.client.get('/api/status').headers['ETag']
+        
+        mock_check.return_value = {
+            'gemini': {'status': 'operational', 'message': 'API is operational', 'response_time': 250}
+        }
+        response = self.client.get('/api/status', headers={'If-None-Match': etag})
+        
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], etag)
+    
+    @patch('cineman.routes.api.check_all_apis')
+    def test_status_endpoint_etag_changes_with_status(self, mock_check):
+        """Test a changed service status gets a new ETag and a full response."""
+        mock_check.return_value = {
+            'gemini': {'status': 'operational', 'message': 'API is operational', 'response_time': 100}
+        }
+        etag = self.client.get('/api/status').headers['ETag']
+        
+        mock_check.return_value = {
+            'gemini': {'status': 'error', 'message': 'Connection failed', 'response_time': 0}
+        }
+        response = self.client.get('/api/status', headers={'If-None-Match': etag})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(response.get_json()['services']['gemini']['status'], 'error')
+    
     @patch('cineman.routes.api.check_all_apis')
     def test_status_endpoint_error(self, mock_check):
         """Test /api/status endpoint when check fails."""
         # Mock error
         mock_check.side_effect = Exception('Test error')
         
-        response = self.client.get('/api/status')
+        response = self.client.get('/api/status?no_fallback=1')
         
         self.assertEqual(response.status_code, 500)
         data = response.get_json()
         self.assertEqual(data['status'], 'error')
+    
+    @patch('cineman.routes.api.get_last_known_status')
+    @patch('cineman.routes.api.check_all_apis')
+    def test_status_endpoint_stale_fallback(self, mock_check, mock_last_known):
+        """Test /api/status serves the last known result when a check fails."""
+        mock_check.side_effect = Exception('Test error')
+        mock_last_known.return_value = ({
+            'gemini': {
+                'status': 'operational',
+                'message': 'API is operational',
+                'response_time': 100
+            }
+        }, 1700000000.0)
+        
+        response = self.client.get('/api/status')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data['status'], 'success')
+        self.assertTrue(data['stale'])
+        self.assertEqual(data['timestamp'], 1700000000)
+        self.assertIn('gemini', data['services'])
 
 
 if __name__ == '__main__':
@@ -3,224 +3,181 @@ Tests for the Flask application core functionality.
 Tests Flask app startup, routes, and error handling.
 """
 
-import sys
-import os
-import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
 
-# Add parent directory to path so we can import cineman module
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+
+from sqlalchemy import func, select
 
 from cineman.app import app, db
+from cineman.models import MovieInteraction
 
 
-class TestFlaskAppStartup(unittest.TestCase):
+class TestFlaskAppStartup:
     """Test Flask application startup and configuration."""
     
-    def setUp(self):
-        """Set up test client before each test."""
-        app.config['TESTING'] = True
-        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        app.config['SECRET_KEY'] = 'test-secret-key'
-        self.client = app.test_client()
-        
-        with app.app_context():
-            db.create_all()
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        with app.app_context():
-            db.session.remove()
-            db.drop_all()
-    
     def test_app_exists(self):
         """Test that the Flask app object exists."""
-        self.assertIsNotNone(app)
+        assert app is not None
     
     def test_app_is_flask_instance(self):
         """Test that app is a Flask instance."""
         from flask import Flask
-        self.assertIsInstance(app, Flask)
+        assert isinstance(app, Flask)
     
     def test_app_name(self):
         """Test that app has correct name."""
-        self.assertEqual(app.name, 'cineman.app')
+        assert app.name == 'cineman.app'
 
 
-class TestHealthEndpoint(unittest.TestCase):
+class TestHealthEndpoint:
     """Test the health check endpoint."""
     
-    def setUp(self):
-        """Set up test client before each test."""
-        app.config['TESTING'] = True
-        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        app.config['SECRET_KEY'] = 'test-secret-key'
-        self.client = app.test_client()
-        
-        with app.app_context():
-            db.create_all()
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        with app.app_context():
-            db.session.remove()
-            db.drop_all()
-    
-    def test_health_endpoint_exists(self):
+    def test_health_endpoint_exists(self, client):
         """Test that health endpoint exists and returns 200."""
-        response = self.client.get('/health')
-        self.assertEqual(response.status_code, 200)
+        response = client.get('/health')
+        assert response.status_code == 200
     
-    def test_health_endpoint_returns_json(self):
+    def test_health_endpoint_returns_json(self, client):
         """Test that health endpoint returns JSON."""
-        response = self.client.get('/health')
-        self.assertEqual(response.content_type, 'application/json')
+        response = client.get('/health')
+        assert response.content_type == 'application/json'
     
-    def test_health_endpoint_status_healthy(self):
+    def test_health_endpoint_status_healthy(self, client):
         """Test that health endpoint reports healthy status."""
-        response = self.client.get('/health')
+        response = client.get('/health')
         data = response.get_json()
-        self.assertEqual(data['status'], 'healthy')
-        self.assertEqual(data['service'], 'cineman')
+        assert data['status'] == 'healthy'
+        assert data['service'] == 'cineman'
 
+    
+    def test_health_endpoint_304_on_match(self, client):
+        """Test that a matching If-None-Match gets an empty 304."""
+        etag = client.get('/health').headers['ETag']
+        response = client.get('/health', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
 
-class TestIndexRoute(unittest.TestCase):
+class TestIndexRoute:
     """Test the main index route."""
     
-    def setUp(self):
-        """Set up test client before each test."""
-        app.config['TESTING'] = True
-        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        app.config['SECRET_KEY'] = 'test-secret-key'
-        self.client = app.test_client()
-        
-        with app.app_context():
-            db.create_all()
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        with app.app_context():
-            db.session.remove()
-            db.drop_all()
-    
-    def test_index_returns_200(self):
+    def test_index_returns_200(self, client):
         """Test that index route returns 200."""
-        response = self.client.get('/')
-        self.assertEqual(response.status_code, 200)
+        response = client.get('/')
+        assert response.status_code == 200
     
-    def test_index_returns_html(self):
+    def test_index_returns_html(self, client):
         """Test that index route returns HTML content."""
-        response = self.client.get('/')
-        self.assertTrue(response.content_type.startswith('text/html'))
+        response = client.get('/')
+        assert response.content_type.startswith('text/html')
 
 
-class TestChatEndpoint(unittest.TestCase):
+class TestChatEndpoint:
     """Test the chat endpoint validation."""
     
-    def setUp(self):
-        """Set up test client before each test."""
-        app.config['TESTING'] = True
-        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        app.config['SECRET_KEY'] = 'test-secret-key'
-        self.client = app.test_client()
-        
-        with app.app_context():
-            db.create_all()
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        with app.app_context():
-            db.session.remove()
-            db.drop_all()
-    
-    def test_chat_requires_post(self):
+    def test_chat_requires_post(self, client):
         """Test that chat endpoint requires POST method."""
-        response = self.client.get('/chat')
-        self.assertEqual(response.status_code, 405)
+        response = client.get('/chat')
+        assert response.status_code == 405
     
-    def test_chat_requires_message(self):
+    def test_chat_requires_message(self, client):
         """Test that chat endpoint requires a message or handles missing AI gracefully."""
-        response = self.client.post('/chat', json={})
+        response = client.post('/chat', json={})
         # May return 400 (missing message) or 503 (AI not initialized)
-        self.assertIn(response.status_code, [400, 503])
+        assert response.status_code in [400, 503]
         data = response.get_json()
-        self.assertIn('response', data)
+        assert 'response' in data
     
-    def test_chat_empty_message(self):
+    def test_chat_empty_message(self, client):
         """Test that chat endpoint rejects empty message or handles missing AI."""
-        response = self.client.post('/chat', json={'message': ''})
+        response = client.post('/chat', json={'message': ''})
         # May return 400 (empty message) or 503 (AI not initialized)
-        self.assertIn(response.status_code, [400, 503])
+        assert response.status_code in [400, 503]
 
 
-class TestSessionClearEndpoint(unittest.TestCase):
+class TestSessionClearEndpoint:
     """Test the session clear endpoint."""
     
-    def setUp(self):
-        """Set up test client before each test."""
-        app.config['TESTING'] = True
-        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        app.config['SECRET_KEY'] = 'test-secret-key'
-        self.client = app.test_client()
-        
-        with app.app_context():
-            db.create_all()
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        with app.app_context():
-            db.session.remove()
-            db.drop_all()
-    
-    def test_session_clear_returns_success(self):
+    def test_session_clear_returns_success(self, client):
         """Test that session clear endpoint returns success."""
-        response = self.client.post('/session/clear')
-        self.assertEqual(response.status_code, 200)
+        response = client.post('/session/clear')
+        assert response.status_code == 200
         data = response.get_json()
-        self.assertEqual(data['status'], 'success')
+        assert data['status'] == 'success'
 
 
-class TestAPIRoutes(unittest.TestCase):
+class TestAPIRoutes:
     """Test API routes exist and respond correctly."""
     
-    def setUp(self):
-        """Set up test client before each test."""
-        app.config['TESTING'] = True
-        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        app.config['SECRET_KEY'] = 'test-secret-key'
-        self.client = app.test_client()
+    @pytest.fixture
+    def session_client(self, client):
+        """Test client with a session id, which the watchlist route requires."""
+        with client.session_transaction() as sess:
+            sess['session_id'] = 'test-session-123'
+        return client
+    
+    @pytest.mark.parametrize('path', [
+        '/api/rate-limit',
+        '/api/metrics',
+        '/api/status',
+        '/api/watchlist',
+    ])
+    def test_endpoint_exists(self, session_client, path):
+        """Test that the API endpoint exists and returns 200."""
+        response = session_client.get(path)
+        assert response.status_code == 200
+
+
+class TestDatabaseIsolation:
+    """Test that the client fixture keeps route writes inside the test's transaction."""
+    
+    def test_route_commit_stays_in_test_transaction(self, client):
+        """Test a committed interaction is visible to the test but not to other connections."""
+        response = client.post('/api/interaction', json={'movie_title': 'Inception', 'action': 'like'})
+        assert response.status_code == 200
         
         with app.app_context():
-            db.create_all()
+            assert MovieInteraction.query.filter_by(movie_title='Inception').count() == 1
+            with db.engine.connect() as other:
+                count = other.execute(select(func.count()).select_from(MovieInteraction)).scalar()
+        assert count == 0
+
+
+class TestMovieRouteCaching:
+    """Test that repeated movie lookups are served from the movie cache."""
     
-    def tearDown(self):
-        """Clean up after each test."""
-        with app.app_context():
-            db.session.remove()
-            db.drop_all()
-    
-    def test_rate_limit_endpoint_exists(self):
-        """Test that rate limit status endpoint exists."""
-        response = self.client.get('/api/rate-limit')
-        self.assertEqual(response.status_code, 200)
-    
-    def test_metrics_endpoint_exists(self):
-        """Test that metrics endpoint exists."""
-        response = self.client.get('/api/metrics')
-        self.assertEqual(response.status_code, 200)
-    
-    def test_api_status_endpoint_exists(self):
-        """Test that API status endpoint exists."""
-        response = self.client.get('/api/status')
-        self.assertEqual(response.status_code, 200)
-    
-    def test_watchlist_endpoint_exists(self):
-        """Test that watchlist endpoint exists."""
-        with self.client as client:
-            with client.session_transaction() as sess:
-                sess['session_id'] = 'test-session-123'
-            response = client.get('/api/watchlist')
-            self.assertEqual(response.status_code, 200)
-
-
-if __name__ == '__main__':
-    unittest.main()
+    def test_movie_poster_cached(self, client):
+        """Test that a repeated poster lookup makes no second TMDb call."""
+        tmdb_response = SimpleNamespace(json=lambda: {"results": [{
+            "id": 27205, "title": "Inception", "poster_path": "/inception.jpg",
+            "release_date": "2010-07-16", "vote_average": 8.4, "vote_count": 35000,
+        }]})
+        
+        with patch('cineman.tools.tmdb.TMDB_API_KEY', 'test-key'), \
+                patch('cineman.tools.tmdb._get_tmdb_client') as mock_client:
+            mock_client.return_value.get.return_value = tmdb_response
+            
+            first = client.get('/api/movie/poster?title=Inception')
+            second = client.get('/api/movie/poster?title=inception')
+        
+        assert first.get_json() == second.get_json()
+        assert mock_client.return_value.get.call_count == 1
+    
+    def test_movie_facts_cached(self, client):
+        """Test that a repeated facts lookup makes no second OMDb call."""
+        omdb_response = SimpleNamespace(json=lambda: {
+            "Response": "True", "Title": "Inception", "Year": "2010",
+            "Director": "Christopher Nolan", "imdbRating": "8.8", "Ratings": [],
+        })
+        
+        with patch('cineman.tools.omdb.OMDB_API_KEY', 'test-key'), \
+                patch('cineman.tools.omdb._get_omdb_client') as mock_client:
+            mock_client.return_value.get.return_value = omdb_response
+            
+            first = client.get('/api/movie/facts?title=Inception')
+            second = client.get('/api/movie/facts?title=Inception')
+        
+        assert first.get_json()['status'] == 'success'
+        assert second.get_json()['Title'] == 'Inception'
+        assert mock_client.return_value.get.call_count == 1
@@ -12,9 +12,10 @@ Tests cover:
 """
 
 import pytest
-import time
+import sys
+import threading
 from unittest.mock import patch
-from cineman.cache import MovieCache, CacheEntry, CacheStats, get_cache
+from cineman.cache import MovieCache, CacheEntry, CacheStats, get_cache, _normalize_key_cached, EXPIRY_HEAP_SLACK
 
 
 class TestCacheInitialization:
@@ -133,6 +134,37 @@ class TestKeyNormalization:
         key = cache._normalize_key("", source="test")
         assert key == "test:"
 
+    @pytest.mark.parametrize("title,expected", [
+        ("Inception", "tmdb:inception"),
+        ("The Dark Knight", "tmdb:dark knight"),
+        ("A Quiet Place", "tmdb:quiet place"),
+        ("Anna", "tmdb:anna"),
+        ("The", "tmdb:the"),
+        ("Se7en", "tmdb:se7en"),
+    ])
+    def test_normalize_plain_titles(self, title, expected):
+        """Test keys for plain ASCII titles, which skip the regex pipeline."""
+        cache = MovieCache()
+        assert cache._normalize_key(title, source="tmdb") == expected
+    
+    def test_normalize_case_variants_share_key_object(self):
+        """Test that titles normalizing to the same key return the same interned string."""
+        cache = MovieCache()
+        key1 = cache._normalize_key("Interned Movie", source="tmdb")
+        key2 = cache._normalize_key("INTERNED MOVIE", source="tmdb")
+        
+        assert key1 is key2
+    
+    def test_normalize_repeated_lookup_is_memoized(self):
+        """Test that normalizing the same title again reuses the cached key."""
+        cache = MovieCache()
+        key1 = cache._normalize_key("Memoized Movie", year="2001", source="tmdb")
+        hits_before = _normalize_key_cached.cache_info().hits
+        key2 = cache._normalize_key("Memoized Movie", year="2001", source="tmdb")
+
+        assert key1 is key2
+        assert _normalize_key_cached.cache_info().hits == hits_before + 1
+
 
 class TestBasicCacheOperations:
     """Test basic cache get/set operations."""
@@ -192,14 +224,54 @@ class TestBasicCacheOperations:
         result = cache.get("Inception", source="tmdb")
         
         assert result is None
+    
+    def test_set_many_and_get_many(self):
+        """Test batch set/get round-trips and counts hits and misses per title."""
+        cache = MovieCache()
+        cache.set_many({
+            "Inception": {"title": "Inception"},
+            "The Matrix": {"title": "The Matrix"},
+        }, source="tmdb")
+        
+        found = cache.get_many(["inception", "THE MATRIX", "Heat"], source="tmdb")
+        
+        assert found == {
+            "inception": {"title": "Inception"},
+            "THE MATRIX": {"title": "The Matrix"},
+        }
+        assert cache.get("The Matrix", source="tmdb") == {"title": "The Matrix"}
+        stats = cache.get_stats()
+        assert stats["hits"] == 3
+        assert stats["misses"] == 1
+    
+    def test_get_many_skips_expired(self, fake_clock):
+        """Test that batch lookups treat expired entries as misses."""
+        cache = MovieCache(ttl=1, clock=fake_clock)
+        cache.set_many({"Inception": {"title": "Inception"}}, source="tmdb")
+        fake_clock.advance(1.1)
+        
+        assert cache.get_many(["Inception"], source="tmdb") == {}
+        assert cache.get_stats()["current_size"] == 0
+    
+    def test_disabled_cache_skips_key_normalization(self):
+        """Test that a disabled cache returns before normalizing any key."""
+        cache = MovieCache(enabled=False)
+        
+        with patch.object(cache, '_normalize_key') as mock_normalize:
+            cache.set("Inception", {"title": "Inception"}, source="tmdb")
+            assert cache.get("Inception", source="tmdb") is None
+            assert cache.evict("Inception", source="tmdb") is False
+            assert cache.clear(source="tmdb") == 0
+        
+        mock_normalize.assert_not_called()
 
 
 class TestTTLExpiration:
     """Test TTL enforcement and expiration."""
     
-    def test_entry_expires_after_ttl(self):
+    def test_entry_expires_after_ttl(self, fake_clock):
         """Test that entry expires after TTL."""
-        cache = MovieCache(ttl=1)  # 1 second TTL
+        cache = MovieCache(ttl=1, clock=fake_clock)  # 1 second TTL
         data = {"title": "Inception"}
         
         cache.set("Inception", data, source="tmdb")
@@ -209,15 +281,15 @@ class TestTTLExpiration:
         assert result1 is not None
         
         # Wait for expiration
-        time.sleep(1.1)
+        fake_clock.advance(1.1)
         
         # Should be expired now
         result2 = cache.get("Inception", source="tmdb")
         assert result2 is None
     
-    def test_custom_ttl_per_entry(self):
+    def test_custom_ttl_per_entry(self, fake_clock):
         """Test custom TTL for individual entries."""
-        cache = MovieCache(ttl=10)  # Default 10 seconds
+        cache = MovieCache(ttl=10, clock=fake_clock)  # Default 10 seconds
         data = {"title": "Inception"}
         
         # Set with custom short TTL
@@ -228,26 +300,70 @@ class TestTTLExpiration:
         assert result1 is not None
         
         # Wait for custom TTL to expire
-        time.sleep(1.1)
+        fake_clock.advance(1.1)
         
         # Should be expired
         result2 = cache.get("Inception", source="tmdb")
         assert result2 is None
     
-    def test_expired_entry_increments_evictions(self):
+    def test_expired_entry_increments_evictions(self, fake_clock):
         """Test that expired entries increment eviction counter."""
-        cache = MovieCache(ttl=1)
+        cache = MovieCache(ttl=1, clock=fake_clock)
         data = {"title": "Inception"}
         
         cache.set("Inception", data, source="tmdb")
         stats1 = cache.get_stats()
         
-        time.sleep(1.1)
+        fake_clock.advance(1.1)
         cache.get("Inception", source="tmdb")
         
         stats2 = cache.get_stats()
         assert stats2["evictions"] == stats1["evictions"] + 1
 
+    def test_expired_entries_purged_without_lookup(self, fake_clock):
+        """Test that expired entries are dropped by later calls even if never read."""
+        cache = MovieCache(ttl=10, clock=fake_clock)
+        for i in range(3):
+            cache.set(f"Movie{i}", {"title": f"Movie{i}"}, source="tmdb")
+
+        fake_clock.advance(11)
+        cache.set("Fresh Movie", {"title": "Fresh Movie"}, source="tmdb")
+
+        stats = cache.get_stats()
+        assert stats["current_size"] == 1
+        assert stats["evictions"] == 3
+
+    def test_updated_entry_not_purged_by_old_expiry(self, fake_clock):
+        """Test that re-setting an entry replaces its earlier expiry time."""
+        cache = MovieCache(ttl=10, clock=fake_clock)
+        cache.set("Inception", {"title": "Inception"}, source="tmdb")
+
+        fake_clock.advance(5)
+        cache.set("Inception", {"title": "Inception", "updated": True}, source="tmdb")
+
+        fake_clock.advance(6)
+        assert cache.get("Inception", source="tmdb")["updated"] is True
+
+    def test_expiry_heap_compacted_after_repeated_updates(self):
+        """Test that updating one entry many times does not grow the expiry heap unbounded."""
+        cache = MovieCache(ttl=300)
+        for i in range(500):
+            cache.set("Inception", {"title": "Inception", "version": i}, source="tmdb")
+        
+        assert len(cache._expiry_heap) <= 2 * len(cache._cache) + EXPIRY_HEAP_SLACK
+        assert cache.get("Inception", source="tmdb")["version"] == 499
+    
+    def test_no_purge_before_earliest_expiry(self):
+        """Test that get/set skip the expiry purge while nothing can have expired."""
+        cache = MovieCache(ttl=300)
+        cache.set("Inception", {"title": "Inception"}, source="tmdb")
+
+        with patch.object(cache, '_purge_expired') as mock_purge:
+            cache.get("Inception", source="tmdb")
+            cache.set("Interstellar", {"title": "Interstellar"}, source="tmdb")
+
+        mock_purge.assert_not_called()
+
 
 class TestLRUEviction:
     """Test LRU eviction when max size reached."""
@@ -298,6 +414,35 @@ class TestLRUEviction:
         assert cache.get("Movie3", source="tmdb") is not None
         assert cache.get("Movie4", source="tmdb") is not None
     
+    def test_lru_update_refreshes_order(self):
+        """Test that re-setting an entry marks it most recently used."""
+        cache = MovieCache(max_size=3)
+        
+        cache.set("Movie1", {"title": "Movie1"}, source="tmdb")
+        cache.set("Movie2", {"title": "Movie2"}, source="tmdb")
+        cache.set("Movie3", {"title": "Movie3"}, source="tmdb")
+        cache.set("Movie1", {"title": "Movie1", "updated": True}, source="tmdb")
+        
+        # Movie2 is now the least recently used
+        cache.set("Movie4", {"title": "Movie4"}, source="tmdb")
+        
+        assert cache.get("Movie2", source="tmdb") is None
+        assert cache.get("Movie1", source="tmdb")["updated"] is True
+        assert cache.get_stats()["current_size"] == 3
+
+    def test_lru_scan_keeps_hit_entries(self):
+        """Test that a sweep of one-off inserts does not evict entries that were hit."""
+        cache = MovieCache(max_size=10)
+
+        cache.set("Hot Movie", {"title": "Hot Movie"}, source="tmdb")
+        cache.get("Hot Movie", source="tmdb")
+
+        for i in range(50):
+            cache.set(f"Scan Movie {i}", {"title": f"Scan Movie {i}"}, source="tmdb")
+
+        assert cache.get("Hot Movie", source="tmdb") == {"title": "Hot Movie"}
+        assert cache.get_stats()["current_size"] == 10
+
     def test_lru_eviction_increments_counter(self):
         """Test that LRU eviction increments eviction counter."""
         cache = MovieCache(max_size=2)
@@ -314,6 +459,51 @@ class TestLRUEviction:
         assert stats2["evictions"] == stats1["evictions"] + 1
 
 
+class TestTinyLFUAdmission:
+    """Test the frequency-based admission policy."""
+    
+    def test_default_policy_is_lru(self):
+        """Test that caches use plain LRU unless configured otherwise."""
+        cache = MovieCache()
+        assert cache.policy == "lru"
+    
+    @patch.dict('os.environ', {'MOVIE_CACHE_POLICY': 'tinylfu'})
+    def test_policy_from_env(self):
+        """Test the policy can be selected via environment."""
+        cache = MovieCache()
+        assert cache.policy == "tinylfu"
+    
+    def test_unknown_policy_rejected(self):
+        """Test that an unknown policy name raises ValueError."""
+        with pytest.raises(ValueError):
+            MovieCache(policy="fifo")
+    
+    def test_cold_entry_not_admitted_over_hot_one(self):
+        """Test that a one-off title does not displace a frequently requested one."""
+        cache = MovieCache(max_size=1, policy="tinylfu")
+        cache.set("Hot Movie", {"title": "Hot Movie"}, source="tmdb")
+        for _ in range(3):
+            cache.get("Hot Movie", source="tmdb")
+        
+        cache.set("Cold Movie", {"title": "Cold Movie"}, source="tmdb")
+        
+        assert cache.get("Cold Movie", source="tmdb") is None
+        assert cache.get("Hot Movie", source="tmdb") is not None
+        assert cache.get_stats()["evictions"] == 0
+    
+    def test_lru_policy_admits_every_entry(self):
+        """Test that the LRU policy still evicts the hot entry in the same scenario."""
+        cache = MovieCache(max_size=1, policy="lru")
+        cache.set("Hot Movie", {"title": "Hot Movie"}, source="tmdb")
+        for _ in range(3):
+            cache.get("Hot Movie", source="tmdb")
+        
+        cache.set("Cold Movie", {"title": "Cold Movie"}, source="tmdb")
+        
+        assert cache.get("Cold Movie", source="tmdb") is not None
+        assert cache.get("Hot Movie", source="tmdb") is None
+
+
 class TestEvictAndClear:
     """Test manual eviction and clearing."""
     
@@ -365,6 +555,19 @@ class TestEvictAndClear:
         # OMDb entry should remain
         assert cache.get("Movie2", source="omdb") is not None
     
+    def test_clear_by_source_after_evictions(self):
+        """Test that entries evicted earlier are not counted when clearing a source."""
+        cache = MovieCache(max_size=2)
+        cache.set("Movie1", {"title": "Movie1"}, source="tmdb")
+        cache.set("Movie2", {"title": "Movie2"}, source="tmdb")
+        cache.evict("Movie2", source="tmdb")
+        cache.set("Movie3", {"title": "Movie3"}, source="omdb")
+        cache.set("Movie4", {"title": "Movie4"}, source="omdb")  # LRU-evicts Movie1
+        
+        assert cache.clear(source="tmdb") == 0
+        assert cache.clear(source="omdb") == 2
+        assert cache.get_stats()["current_size"] == 0
+    
     def test_clear_empty_cache(self):
         """Test clearing empty cache."""
         cache = MovieCache()
@@ -376,6 +579,13 @@ class TestEvictAndClear:
 class TestCacheStatistics:
     """Test cache statistics and metrics."""
     
+    def test_stats_derive_totals_from_counters(self):
+        """Test that total_requests and hit_ratio are derived from hits and misses."""
+        stats = CacheStats(hits=3, misses=1)
+        
+        assert stats.total_requests == 4
+        assert stats.hit_ratio == 0.75
+    
     def test_initial_stats(self):
         """Test initial statistics are zero."""
         cache = MovieCache()
@@ -459,6 +669,14 @@ class TestCacheStatistics:
         key = cache._normalize_key("Inception", source="tmdb")
         entry = cache._cache[key]
         assert entry.hits == 3
+    
+    def test_entry_has_no_instance_dict(self):
+        """Test that cache entries use slots instead of a per-instance __dict__."""
+        entry = CacheEntry(value={}, timestamp=0, ttl=60, source="tmdb")
+        
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.unexpected = True
 
 
 class TestGlobalCacheInstance:
@@ -471,6 +689,23 @@ class TestGlobalCacheInstance:
         
         assert cache1 is cache2
     
+    def test_get_cache_concurrent_first_calls_share_instance(self):
+        """Test that threads racing on the first get_cache() get one instance."""
+        barrier = threading.Barrier(8)
+        results = []
+        
+        def worker():
+            barrier.wait()
+            results.append(get_cache())
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len({id(cache) for cache in results}) == 1
+    
     def test_global_cache_persists_data(self):
         """Test that global cache persists data across calls."""
         cache1 = get_cache()
@@ -592,3 +827,46 @@ class TestCacheIntegration:
         assert cache.get("Movie149", source="tmdb") is not None
         # Oldest entries should be evicted
         assert cache.get("Movie0", source="tmdb") is None
+    
+    def test_concurrent_get_and_set_keep_cache_consistent(self):
+        """Test that threads sharing one small cache do not corrupt its LRU lists."""
+        cache = MovieCache(max_size=50)
+        barrier = threading.Barrier(16)
+        errors = []
+        
+        def worker(offset):
+            barrier.wait()
+            try:
+                for i in range(2000):
+                    title = f"Movie{(i * 7 + offset) % 120}"
+                    if cache.get(title, source="tmdb") is None:
+                        cache.set(title, {"id": i}, source="tmdb")
+                    if i % 50 == 0:
+                        cache.evict(title, source="tmdb")
+            except Exception as exc:
+                errors.append(exc)
+        
+        # Switch threads far more often than the default 5ms to force interleaving
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=worker, args=(n,)) for n in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        
+        assert errors == []
+        
+        # Both LRU segments together link exactly the stored entries
+        linked = []
+        for segment in (cache._probation, cache._protected):
+            entry = segment.next
+            while entry is not segment:
+                linked.append(entry.normalized_key)
+                entry = entry.next
+        assert sorted(linked) == sorted(cache._cache)
+        assert len(cache._cache) <= 50
+        assert cache.get_stats()["current_size"] == len(cache._cache)
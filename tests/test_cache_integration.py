@@ -11,7 +11,6 @@ These integration tests validate the end-to-end scenarios.
 """
 
 import pytest
-import time
 from cineman.cache import get_cache, MovieCache
 
 
@@ -50,9 +49,9 @@ class TestCacheBasicIntegration:
         assert tmdb_result["rating"] == 8.8
         assert omdb_result["rating"] == 8.7
     
-    def test_cache_expiration_workflow(self):
+    def test_cache_expiration_workflow(self, fake_clock):
         """Test that expired entries are properly evicted."""
-        cache = MovieCache(ttl=1)  # 1 second TTL
+        cache = MovieCache(ttl=1, clock=fake_clock)  # 1 second TTL
         
         data = {"title": "Test Movie"}
         cache.set("Test", data, source="test")
@@ -62,7 +61,7 @@ class TestCacheBasicIntegration:
         assert result1 is not None
         
         # Wait for expiration
-        time.sleep(1.1)
+        fake_clock.advance(1.1)
         
         # Should be expired
         result2 = cache.get("Test", source="test")
@@ -6,33 +6,24 @@ import sys
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 
+import pytest
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from cineman.app import app, db
 from cineman.session_manager import SessionManager
 
 
 class TestConversationHolding(unittest.TestCase):
     """Test cases for conversation holding and context management."""
     
-    def setUp(self):
-        """Set up test client and database before each test."""
-        app.config['TESTING'] = True
-        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        app.config['SECRET_KEY'] = 'test-secret-key'
-        
-        self.client = app.test_client()
-        
-        # Create tables
-        with app.app_context():
-            db.create_all()
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        with app.app_context():
-            db.session.remove()
-            db.drop_all()
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        """
+        Use the shared test client, whose database work is rolled back after
+        each test instead of recreating the schema.
+        """
+        self.client = client
     
     @patch('cineman.app.llm_service')
     def test_session_persists_across_messages(self, mock_service):
@@ -353,6 +344,57 @@ class TestConversationalPrompts(unittest.TestCase):
         self.assertTrue(len(scenario3) > 0)
 
 
+class TestRecommendationChain(unittest.TestCase):
+    """Test construction and caching of the recommendation chain."""
+    
+    def setUp(self):
+        """Start every test with an empty chain cache."""
+        from cineman.chain import _build_chain
+        _build_chain.cache_clear()
+        self.addCleanup(_build_chain.cache_clear)
+    
+    @patch.dict(os.environ, {}, clear=True)
+    def test_no_api_key_returns_none(self):
+        """Test that a missing API key yields no chain."""
+        from cineman.chain import get_recommendation_chain
+        
+        self.assertIsNone(get_recommendation_chain())
+    
+    @patch('cineman.chain.ChatGoogleGenerativeAI')
+    @patch.dict(os.environ, {'GEMINI_API_KEY': 'test-key'})
+    def test_chain_is_built_once(self, mock_llm_class):
+        """Test that repeated calls reuse the same chain."""
+        from cineman.chain import get_recommendation_chain
+        
+        chain1 = get_recommendation_chain()
+        chain2 = get_recommendation_chain()
+        
+        self.assertIsNotNone(chain1)
+        self.assertIs(chain1, chain2)
+        mock_llm_class.assert_called_once()
+    
+    @patch('cineman.chain.ChatGoogleGenerativeAI')
+    def test_chain_rebuilt_when_api_key_changes(self, mock_llm_class):
+        """Test that a different API key builds a new chain."""
+        from cineman.chain import get_recommendation_chain
+        
+        with patch.dict(os.environ, {'GEMINI_API_KEY': 'key-one'}):
+            chain1 = get_recommendation_chain()
+        with patch.dict(os.environ, {'GEMINI_API_KEY': 'key-two'}):
+            chain2 = get_recommendation_chain()
+        
+        self.assertIsNot(chain1, chain2)
+        self.assertEqual(mock_llm_class.call_count, 2)
+    
+    def test_escape_braces_for_prompt(self):
+        """Test that braces are doubled and empty input is passed through."""
+        from cineman.chain import escape_braces_for_prompt
+        
+        self.assertEqual(escape_braces_for_prompt('{"title": "{x}"}'), '{{"title": "{{x}}"}}')
+        self.assertEqual(escape_braces_for_prompt(''), '')
+        self.assertIsNone(escape_braces_for_prompt(None))
+
+
 if __name__ == '__main__':
     print("\n" + "="*70)
     print("Running Conversation Holding Tests")
@@ -18,6 +18,9 @@ from cineman.chain import get_recommendation_chain, format_chat_history
 from cineman.session_manager import SessionManager
 from langchain_core.messages import HumanMessage, AIMessage
 
+# Independent prompts sent to the LLM at once; keeps bursts under the provider's rate limit
+MAX_CONCURRENT_CALLS = 5
+
 
 def print_separator(title=""):
     """Print a visual separator."""
@@ -28,6 +31,12 @@ def print_separator(title=""):
     print()
 
 
+def invoke_all(chain, prompts):
+    """Return the chain's responses to independent prompts (no chat history), in prompt order."""
+    inputs = [{"user_input": prompt, "chat_history": []} for prompt in prompts]
+    return chain.batch(inputs, config={"max_concurrency": MAX_CONCURRENT_CALLS})
+
+
 def test_conversational_flow():
     """Test a full conversation flow with the LLM."""
     print_separator("Testing Conversational Flow")
@@ -95,19 +104,21 @@ def test_conversational_flow():
             })
             elapsed_time = time.time() - start_time
             
+            # The chain returns a ChatResponse; the history keeps only its text
+            response_text = response.response_text
+            
             # Add to session
             session_data.add_message("user", step['user'])
-            session_data.add_message("assistant", response)
+            session_data.add_message("assistant", response_text)
             
             # Print response
-            print(f"Assistant: {response[:500]}...")  # First 500 chars
-            if len(response) > 500:
-                print(f"  ... (response continues, total length: {len(response)} chars)")
+            print(f"Assistant: {response_text[:500]}...")  # First 500 chars
+            if len(response_text) > 500:
+                print(f"  ... (response continues, total length: {len(response_text)} chars)")
             print(f"  [Response time: {elapsed_time:.2f}s]")
             
-            # Check if response contains JSON (indicates recommendation mode)
-            has_json = response.rfind('{') != -1 and response.rfind('}') != -1
-            detected_mode = "recommendation" if has_json else "conversational"
+            # Structured movies in the response indicate recommendation mode
+            detected_mode = "recommendation" if response.movies else "conversational"
             
             print(f"  Expected mode: {step['expected_mode']}")
             print(f"  Detected mode: {detected_mode}")
@@ -153,20 +164,18 @@ def test_recommendation_request_variations():
             "suggest good horror movies"
         ]
         
-        for i, request in enumerate(requests, 1):
+        # The requests don't depend on each other, so send them all at once
+        responses = invoke_all(chain, requests)
+        
+        for i, (request, response) in enumerate(zip(requests, responses), 1):
             print(f"Test {i}: {request}")
             print("-" * 80)
             
-            response = chain.invoke({
-                "user_input": request,
-                "chat_history": []
-            })
-            
-            # Check if JSON manifest is present
-            has_json = '{"movies":' in response or '"movies":' in response
-            has_anchor = 'anchor:m1' in response
+            # Check if the structured movie manifest is present
+            has_json = bool(response.movies)
+            has_anchor = 'anchor:m1' in response.response_text
             
-            print(f"Response length: {len(response)} chars")
+            print(f"Response length: {len(response.response_text)} chars")
             print(f"  Has JSON manifest: {'✅ YES' if has_json else '❌ NO'}")
             print(f"  Has anchor markers: {'✅ YES' if has_anchor else '❌ NO'}")
             
@@ -176,7 +185,6 @@ def test_recommendation_request_variations():
                 print("  ⚠️  May not be in proper recommendation format")
             
             print()
-            time.sleep(1)
         
         print_separator("Recommendation Variations Test Complete")
         return True
@@ -208,20 +216,18 @@ def test_conversational_questions():
             "What made Inception so popular?"
         ]
         
-        for i, question in enumerate(questions, 1):
+        # The questions don't depend on each other, so send them all at once
+        responses = invoke_all(chain, questions)
+        
+        for i, (question, response) in enumerate(zip(questions, responses), 1):
             print(f"Test {i}: {question}")
             print("-" * 80)
             
-            response = chain.invoke({
-                "user_input": question,
-                "chat_history": []
-            })
-            
             # Check that it's NOT in recommendation format
-            has_json = '{"movies":' in response or '"movies":' in response
-            has_anchor = 'anchor:m1' in response
+            has_json = bool(response.movies)
+            has_anchor = 'anchor:m1' in response.response_text
             
-            print(f"Response length: {len(response)} chars")
+            print(f"Response length: {len(response.response_text)} chars")
             print(f"  Has JSON manifest: {'❌ NO' if not has_json else '⚠️  YES (unexpected)'}")
             print(f"  Has anchor markers: {'❌ NO' if not has_anchor else '⚠️  YES (unexpected)'}")
             
@@ -231,7 +237,6 @@ def test_conversational_questions():
                 print("  ⚠️  Unexpected recommendation format for conversational question")
             
             print()
-            time.sleep(1)
         
         print_separator("Conversational Questions Test Complete")
         return True
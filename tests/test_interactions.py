@@ -6,34 +6,24 @@ import sys
 import os
 import unittest
 
+import pytest
+
 # Add parent directory to path so we can import cineman module
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from cineman.app import app, db
 from cineman.models import MovieInteraction
 
 
 class TestMovieInteractions(unittest.TestCase):
     """Test cases for movie interaction API endpoints."""
     
-    def setUp(self):
-        """Set up test client and database before each test."""
-        # Configure app for testing
-        app.config['TESTING'] = True
-        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        app.config['SECRET_KEY'] = 'test-secret-key'
-        
-        self.client = app.test_client()
-        
-        # Create tables
-        with app.app_context():
-            db.create_all()
-    
-    def tearDown(self):
-        """Clean up after each test."""
-        with app.app_context():
-            db.session.remove()
-            db.drop_all()
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        """
+        Use the shared test client, whose database work is rolled back after
+        each test instead of recreating the schema.
+        """
+        self.client = client
     
     def test_like_movie(self):
         """Test liking a movie."""
@@ -0,0 +1,65 @@
+"""
+Tests for the orjson-backed Flask JSON provider.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+
+from cineman.app import app
+from cineman.json_provider import OrjsonProvider, init_json_provider
+
+
+@dataclass
+class Movie:
+    title: str
+    year: int
+
+
+@pytest.fixture
+def provider():
+    """Provider on a bare app, independent of the cineman app's config."""
+    return OrjsonProvider(Flask(__name__))
+
+
+class TestOrjsonProvider:
+    """Test OrjsonProvider output against Flask's default provider."""
+    
+    def test_app_uses_orjson_provider(self):
+        """Test the app serializes with orjson."""
+        assert isinstance(app.json, OrjsonProvider)
+    
+    def test_init_json_provider(self):
+        """Test init_json_provider installs the provider."""
+        flask_app = Flask(__name__)
+        init_json_provider(flask_app)
+        assert isinstance(flask_app.json, OrjsonProvider)
+    
+    def test_dumps_sorts_keys(self, provider):
+        """Test keys are sorted like the default provider."""
+        assert provider.dumps({'b': 1, 'a': 2}) == '{"a":2,"b":1}'
+    
+    def test_dumps_falls_back_for_flask_types(self, provider):
+        """Test dates, dataclasses and decimals serialize as with the default provider."""
+        data = {
+            'when': datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            'movie': Movie('Inception', 2010),
+            'rating': Decimal('8.8'),
+        }
+        default = Flask(__name__).json
+        
+        assert json.loads(provider.dumps(data)) == json.loads(default.dumps(data))
+    
+    def test_loads(self, provider):
+        """Test loads accepts str and bytes."""
+        assert provider.loads('{"a": 1}') == {'a': 1}
+        assert provider.loads(b'[1, 2]') == [1, 2]
+    
+    def test_jsonify_response(self, client):
+        """Test a route response round-trips through the provider."""
+        response = client.get('/health')
+        assert response.get_json() == {'status': 'healthy', 'service': 'cineman'}
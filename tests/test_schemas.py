@@ -2,6 +2,7 @@
 Tests for movie data schemas.
 """
 
+import json
 import pytest
 from pydantic import ValidationError
 from cineman.schemas import (
@@ -195,6 +196,19 @@ class TestMovieRecommendation:
         assert "ratings" in movie_dict
         assert "created_at" not in movie_dict or movie_dict["created_at"] is not None
     
+    def test_to_json(self):
+        """Test serialization to a JSON string."""
+        movie = MovieRecommendation(
+            title="Inception",
+            year="2010",
+            ratings=MovieRatings(imdb_rating="8.8")
+        )
+        movie_json = json.loads(movie.to_json())
+        
+        assert movie_json["title"] == "Inception"
+        assert movie_json["ratings"] == {"imdb_rating": "8.8"}
+        assert "poster_url" not in movie_json
+    
     def test_to_legacy_format(self):
         """Test conversion to legacy format."""
         movie = MovieRecommendation(
@@ -348,6 +362,11 @@ class TestParseMovieFromAPI:
         assert movie.ratings.imdb_rating == "8.8"
         assert movie.identifiers.imdb_id == "tt1375666"
         assert movie.credits.director == "Christopher Nolan"
+    
+    def test_parse_missing_title_fails(self):
+        """Test parsing a response with no usable title raises ValueError."""
+        with pytest.raises(ValueError):
+            parse_movie_from_api({"tmdb": {}, "omdb": {}}, source="combined")
 
 
 class TestValidateLLMManifest:
@@ -404,6 +423,27 @@ class TestValidateLLMManifest:
         
         with pytest.raises(ValueError):
             validate_llm_manifest(manifest_json)
+    
+    def test_too_many_movies(self):
+        """Test validating manifest with more than 10 movies."""
+        manifest_json = {
+            "movies": [{"title": f"Movie {i}"} for i in range(11)]
+        }
+        
+        with pytest.raises(ValueError):
+            validate_llm_manifest(manifest_json)
+    
+    def test_invalid_movie_in_manifest(self):
+        """Test that one invalid movie fails the whole manifest."""
+        manifest_json = {
+            "movies": [
+                {"title": "Inception", "year": "2010"},
+                {"title": ""}
+            ]
+        }
+        
+        with pytest.raises(ValueError):
+            validate_llm_manifest(manifest_json)
 
 
 if __name__ == "__main__":
@@ -7,7 +7,7 @@ import sys
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from cineman.session_manager import SessionManager, SessionData
+from cineman.session_manager import SessionManager, SessionData, MAX_CHAT_HISTORY
 
 
 def test_create_session():
@@ -124,6 +124,54 @@ def test_chat_history_limit():
     print(f"✅ Limited history: {len(limited)} messages (last 5)")
 
 
+def test_chat_history_capped():
+    """Test that chat history keeps only the most recent messages."""
+    session = SessionData("test-cap")
+    
+    for i in range(MAX_CHAT_HISTORY + 5):
+        session.add_message("user", f"Message {i}")
+    
+    history = session.get_chat_history()
+    assert len(history) == MAX_CHAT_HISTORY
+    assert history[0]["content"] == "Message 5"
+    assert session.get_chat_history(limit=2)[-1]["content"] == f"Message {MAX_CHAT_HISTORY + 4}"
+    print(f"✅ Chat history capped at {MAX_CHAT_HISTORY} messages")
+
+
+def test_recommended_movies_keep_order_without_duplicates():
+    """Test that repeated recommendations are dropped and first-seen order is kept."""
+    session = SessionData("test-dedup")
+    
+    session.add_recommended_movies(["Inception", "Heat", "Inception"])
+    session.add_recommended_movies(["Alien", "Heat", "Up"])
+    
+    assert session.get_recommended_movies() == ["Inception", "Heat", "Alien", "Up"]
+    print(f"✅ Recommended movies deduplicated in order")
+
+
+def test_session_data_uses_slots():
+    """Test that session data has no per-instance __dict__."""
+    session = SessionData("test-slots")
+    
+    assert not hasattr(session, "__dict__")
+    print(f"✅ SessionData uses __slots__")
+
+
+def test_idle_session_expires():
+    """Test that sessions idle past the timeout are dropped and active ones kept."""
+    manager = SessionManager(session_timeout_minutes=1)
+    idle_id = manager.create_session()
+    active_id = manager.create_session()
+    
+    # Backdate the idle session's last access past the timeout
+    manager.peek_session(idle_id)._last_accessed -= 120
+    
+    assert manager.get_session(active_id) is not None
+    assert manager.peek_session(idle_id) is None
+    assert manager.session_timeout.total_seconds() == 60
+    print(f"✅ Idle session expired after timeout")
+
+
 if __name__ == "__main__":
     print("\n--- Testing Session Manager ---\n")
     
@@ -136,6 +184,14 @@ if __name__ == "__main__":
         print()
         test_chat_history_limit()
         print()
+        test_chat_history_capped()
+        print()
+        test_recommended_movies_keep_order_without_duplicates()
+        print()
+        test_session_data_uses_slots()
+        print()
+        test_idle_session_expires()
+        print()
         print("✅ All tests passed!")
     except AssertionError as e:
         print(f"❌ Test failed: {e}")
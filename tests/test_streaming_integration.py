@@ -1,19 +1,9 @@
 """
 Integration tests for streaming API endpoint.
 """
-import pytest
 import json
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    from cineman.app import app
-    app.config['TESTING'] = True
-    with app.test_client() as client:
-        yield client
-
-
 class TestStreamingAPIEndpoint:
     """Test /api/movie streaming data integration."""
     
@@ -2,6 +2,7 @@
 Tests for LLM hallucination validation module.
 """
 
+import logging
 import pytest
 from unittest.mock import patch, MagicMock
 from cineman.validation import (
@@ -283,6 +284,49 @@ class TestValidationWithMocks:
         # Should still validate with good confidence
         assert result.is_valid is True
         assert result.confidence >= 0.7
+    
+    @patch('cineman.validation.fetch_watchmode_data_core')
+    @patch('cineman.validation.get_movie_poster_core')
+    @patch('cineman.validation.fetch_omdb_data_core')
+    def test_raw_payloads_only_kept_for_debug(self, mock_omdb, mock_tmdb, mock_watchmode, caplog):
+        """Test raw API payloads are dropped unless DEBUG logging is enabled."""
+        mock_tmdb.return_value = {
+            "status": "success",
+            "title": "Inception",
+            "year": "2010",
+            "tmdb_id": 27205,
+            "vote_average": 8.3,
+            "poster_url": "https://image.tmdb.org/t/p/w500/inception.jpg"
+        }
+        mock_omdb.return_value = {
+            "status": "success",
+            "Title": "Inception",
+            "Year": "2010",
+            "IMDb_Rating": "8.8",
+            "Rotten_Tomatoes": "87%",
+            "raw": {"imdbID": "tt1375666"}
+        }
+        mock_watchmode.return_value = {"status": "success", "providers": [{"name": "Netflix"}]}
+        
+        caplog.set_level(logging.INFO, logger="cineman.validation")
+        result = validate_llm_recommendation(title="Inception", year="2010")
+        
+        assert result.tmdb_data is None
+        assert result.omdb_data is None
+        assert result.watchmode_data is None
+        # Typed fields still carry what enrichment needs
+        assert result.poster_url == "https://image.tmdb.org/t/p/w500/inception.jpg"
+        assert result.ratings == {"imdb_rating": "8.8", "rt_tomatometer": "87%", "tmdb_rating": 8.3}
+        assert result.tmdb_id == 27205
+        assert result.imdb_id == "tt1375666"
+        assert result.streaming_providers == [{"name": "Netflix"}]
+        
+        caplog.set_level(logging.DEBUG, logger="cineman.validation")
+        result = validate_llm_recommendation(title="Inception", year="2010")
+        
+        assert result.tmdb_data["raw"]["tmdb_id"] == 27205
+        assert result.omdb_data["raw"]["Title"] == "Inception"
+        assert result.watchmode_data["providers"] == [{"name": "Netflix"}]
 
 
 class TestValidateMovieList: